@@ -4,6 +4,7 @@ use crate::models::WithBaseURL;
 use crate::{errors::*, models::*, tokens::*};
 use base64::{engine::general_purpose::STANDARD, Engine as _};
 use chrono::{DateTime, Utc};
+use futures_util::future::join_all;
 use futures_util::TryStreamExt;
 use reqwest::header::CONTENT_TYPE;
 use reqwest::{
@@ -17,6 +18,7 @@ use sha1::{Digest, Sha1};
 use std::fmt::{Display, Formatter};
 use std::io::{BufWriter, Write};
 use std::path::Path;
+use std::time::Duration;
 use std::{fs::File, io::Read};
 use url::Url;
 
@@ -114,9 +116,15 @@ impl SzurubooruClient {
         header_map.append(ACCEPT, "application/json".parse().unwrap());
         header_map.append(CONTENT_TYPE, "application/json".parse().unwrap());
 
+        // reqwest already pools connections per client; TCP keepalive stops idle pooled
+        // connections from being silently dropped by NATs and proxies between calls.
+        // HTTP/2 is negotiated through ALPN on HTTPS instances; it isn't forced with prior
+        // knowledge because the stock Szurubooru frontend only speaks HTTP/1.1 over plain HTTP
         let client = ClientBuilder::new()
             .danger_accept_invalid_certs(allow_insecure)
             .default_headers(header_map)
+            .tcp_keepalive(Some(Duration::from_secs(60)))
+            .http2_adaptive_window(true)
             .build()
             .unwrap();
 
@@ -1012,7 +1020,9 @@ impl<'a> SzurubooruRequest<'a> {
                 .map_err(SzurubooruClientError::IOError)?;
         }
 
-        Ok(())
+        // Dropping a BufWriter silently discards any error from the final write, so flush here
+        // to report it to the caller
+        writer.flush().map_err(SzurubooruClientError::IOError)
     }
 
     ///Downloads a post's image and writes it to the given file handle
@@ -1058,7 +1068,12 @@ impl<'a> SzurubooruRequest<'a> {
         path: impl AsRef<Path>,
     ) -> SzurubooruResult<()> {
         let mut stream = self.get_thumbnail_bytestream(post_id).await?;
-        let mut file = File::open(path.as_ref()).map_err(SzurubooruClientError::IOError)?;
+        let mut file = File::options()
+            .write(true)
+            .truncate(true)
+            .create(true)
+            .open(path.as_ref())
+            .map_err(SzurubooruClientError::IOError)?;
         self.write_content_to_file(&mut file, &mut stream).await
     }
 
@@ -1087,9 +1102,7 @@ impl<'a> SzurubooruRequest<'a> {
     ) -> SzurubooruResult<ImageSearchResult> {
         let mut file = File::open(&file_path).map_err(SzurubooruClientError::IOError)?;
         let filename = file_path.as_ref().file_name().unwrap().to_str().unwrap();
-        self.reverse_search_file(&mut file, filename)
-            .await
-            .map(|isr| self.propagate_urls(isr))
+        self.reverse_search_file(&mut file, filename).await
     }
 
     // Need to add a reverse search for bytes
@@ -1105,10 +1118,7 @@ impl<'a> SzurubooruRequest<'a> {
         let hex_string = hex::encode(hash);
 
         let qt = QueryToken::token(PostNamedToken::ContentChecksum, hex_string);
-        let psr = self
-            .list_posts(Some(&vec![qt]), 0)
-            .await
-            .map(|psr| self.propagate_urls(psr))?;
+        let psr = self.list_posts(Some(&vec![qt]), 0).await?;
         Ok(psr.results.first().cloned())
     }
 
@@ -1311,6 +1321,21 @@ impl<'a> SzurubooruRequest<'a> {
             .map(|r| self.propagate_urls(r))
     }
 
+    /// Creates several pools at once. Szurubooru has no bulk creation endpoint, so this is not
+    /// atomic: each pool is created by its own request, sent concurrently over the client's
+    /// connection pool. See [create_pool](SzurubooruRequest::create_pool) for the restrictions on
+    /// each [CreateUpdatePool].
+    ///
+    /// Every request is run to completion and its outcome is returned in the same position as
+    /// its [CreateUpdatePool], so when some creations fail the pools that were created can still
+    /// be identified.
+    pub async fn create_pools(
+        &self,
+        create_update_pools: &[CreateUpdatePool],
+    ) -> Vec<SzurubooruResult<PoolResource>> {
+        join_all(create_update_pools.iter().map(|cup| self.create_pool(cup))).await
+    }
+
     /// Updates an existing pool using specified parameters. [names](crate::models::CreateUpdatePool::names),
     /// must match `pool_name_regex` from server's configuration.
     /// [category](crate::models::CreateUpdatePool::category) must exist and is the same as
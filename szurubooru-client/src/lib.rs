@@ -82,6 +82,12 @@ mod szurubooru_client {
     }
 
     #[pymodule(name = "_models")]
+    /// Resources returned by the Szurubooru API.
+    ///
+    /// Each object keeps the deserialized response in its native form and only builds the Python
+    /// value of a field when that attribute is read, so listing many resources and inspecting a
+    /// handful of fields stays cheap. To reduce the work done by the server as well, pass
+    /// ``fields`` to the client methods.
     mod models {
         #[pymodule_export]
         pub use crate::models::{
@@ -1,76 +1,1046 @@
+use crate::errors::SzuruClientError;
 use crate::models::*;
-use crate::py::PyPagedSearchResult;
+use crate::py::{in_runtime, PyPagedSearchResult};
 use crate::tokens::QueryToken;
 use crate::SzurubooruClient;
 use chrono::{DateTime, Utc};
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
+use std::collections::HashMap;
 use std::path::PathBuf;
+use std::sync::Mutex;
 
 #[pyclass(name = "SzurubooruAsyncClient", module = "szurubooru_client")]
 /// An asynchronous client for Szurubooru
 ///
 /// :see: :class:`~szurubooru_client.SzurubooruSyncClient` for supported parameters
 pub struct PythonAsyncClient {
+    core: ClientCore,
+}
+
+/// The implementation shared by both Python clients.
+///
+/// Its futures need a tokio context to run. The synchronous client blocks on them with the runtime
+/// it owns, while the asynchronous client wraps them with [in_runtime] so they can be awaited from
+/// any Python event loop
+pub(crate) struct ClientCore {
     client: SzurubooruClient,
+    category_cache: Option<Mutex<CategoryCache>>,
+}
+
+/// Results of the category ``list`` methods, keyed by the selected fields
+///
+/// Each map has a generation that's bumped whenever it's invalidated. A listing is only stored if
+/// the generation is unchanged since its request was sent, so a response that raced with a write
+/// can't repopulate the cache with stale data
+#[derive(Default)]
+struct CategoryCache {
+    tag_categories: HashMap<Option<Vec<String>>, Vec<TagCategoryResource>>,
+    tag_generation: u64,
+    pool_categories: HashMap<Option<Vec<String>>, Vec<PoolCategoryResource>>,
+    pool_generation: u64,
 }
 
-#[pymethods]
-impl PythonAsyncClient {
-    #[new]
-    #[pyo3(signature = (host, username=None, token=None, password=None, allow_insecure=None))]
-    /// Creates a new instance of the Asynchornous client
+#[pymethods]
+impl PythonAsyncClient {
+    #[new]
+    #[pyo3(signature = (host, username=None, token=None, password=None, allow_insecure=None,
+        cache_categories=None))]
+    /// Creates a new instance of the Asynchornous client
+    ///
+    /// :see: :class:`~szurubooru_client.SzurubooruSyncClient` for supported parameters
+    pub fn new(
+        host: String,
+        username: Option<String>,
+        token: Option<String>,
+        password: Option<String>,
+        allow_insecure: Option<bool>,
+        cache_categories: Option<bool>,
+    ) -> PyResult<Self> {
+        Ok(PythonAsyncClient {
+            core: ClientCore::new(
+                host,
+                username,
+                token,
+                password,
+                allow_insecure,
+                cache_categories,
+            )?,
+        })
+    }
+
+    #[pyo3(signature = (fields=None))]
+    /// List the available tag categories (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_tag_categories` for parameters and return type
+    pub async fn list_tag_categories(
+        &self,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<Vec<TagCategoryResource>> {
+        in_runtime(self.core.list_tag_categories(fields)).await
+    }
+
+    #[pyo3(signature = (name, color=None, order=None, fields=None))]
+    /// Creates a new tag category using the specified parameters (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_tag_category` for parameters and return type
+    pub async fn create_tag_category(
+        &self,
+        name: String,
+        color: Option<String>,
+        order: Option<u32>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<TagCategoryResource> {
+        in_runtime(self.core.create_tag_category(name, color, order, fields)).await
+    }
+
+    #[pyo3(signature = (name, version, new_name=None, color=None, order=None, fields=None))]
+    /// Updates an existing tag category (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_tag_category` for parameters and return type
+    pub async fn update_tag_category(
+        &self,
+        name: String,
+        version: u32,
+        new_name: Option<String>,
+        color: Option<String>,
+        order: Option<u32>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<TagCategoryResource> {
+        in_runtime(self.core.update_tag_category(
+            name,
+            version,
+            new_name,
+            color,
+            order,
+            fields,
+        ))
+        .await
+    }
+
+    #[pyo3(signature = (name, fields=None))]
+    /// Fetches a tag category by name (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_tag_category` for parameters and return type
+    pub async fn get_tag_category(
+        &self,
+        name: String,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<TagCategoryResource> {
+        in_runtime(self.core.get_tag_category(name, fields)).await
+    }
+
+    #[pyo3(signature = (name, version))]
+    /// Deletes a tag category (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_tag_category` for parameters and return type
+    pub async fn delete_tag_category(&self, name: String, version: u32) -> PyResult<()> {
+        in_runtime(self.core.delete_tag_category(name, version)).await
+    }
+
+    #[pyo3(signature = (name))]
+    /// Sets the default tag category for the site (async version)
+    pub async fn set_default_tag_category(&self, name: String) -> PyResult<()> {
+        in_runtime(self.core.set_default_tag_category(name)).await
+    }
+
+    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
+    /// List the tags currently available on the site (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_tags` for parameters and return type
+    pub async fn list_tags(
+        &self,
+        query: Option<Vec<QueryToken>>,
+        fields: Option<Vec<String>>,
+        limit: Option<u32>,
+        offset: Option<u32>,
+    ) -> PyResult<PyPagedSearchResult> {
+        in_runtime(self.core.list_tags(query, fields, limit, offset)).await
+    }
+
+    #[pyo3(signature = (names, category=None, description=None, implications=None, suggestions=None, fields=None))]
+    /// Creating a new tag (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_tag` for parameters and return type
+    pub async fn create_tag(
+        &self,
+        names: Py<PyAny>,
+        category: Option<String>,
+        description: Option<String>,
+        implications: Option<Vec<String>>,
+        suggestions: Option<Vec<String>>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<TagResource> {
+        in_runtime(self.core.create_tag(
+            names,
+            category,
+            description,
+            implications,
+            suggestions,
+            fields,
+        ))
+        .await
+    }
+
+    #[pyo3(signature = (name, version, names=None, category=None, description=None, implications=None, suggestions=None, fields=None))]
+    #[allow(clippy::too_many_arguments)]
+    /// Updates an existing tag (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_tag` for parameters and return type
+    pub async fn update_tag(
+        &self,
+        name: String,
+        version: u32,
+        names: Option<Py<PyAny>>,
+        category: Option<String>,
+        description: Option<String>,
+        implications: Option<Vec<String>>,
+        suggestions: Option<Vec<String>>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<TagResource> {
+        in_runtime(self.core.update_tag(
+            name,
+            version,
+            names,
+            category,
+            description,
+            implications,
+            suggestions,
+            fields,
+        ))
+        .await
+    }
+
+    #[pyo3(signature = (name, fields=None))]
+    /// Fetches an existing tag (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_tag` for parameters and return type
+    pub async fn get_tag(
+        &self,
+        name: String,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<TagResource> {
+        in_runtime(self.core.get_tag(name, fields)).await
+    }
+
+    #[pyo3(signature = (name, version))]
+    /// Deletes an existing tag (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_tag` for parameters and return type
+    pub async fn delete_tag(&self, name: String, version: u32) -> PyResult<()> {
+        in_runtime(self.core.delete_tag(name, version)).await
+    }
+
+    #[pyo3(signature = (remove_tag, remove_tag_version, merge_to_tag, merge_to_version, fields=None))]
+    /// Removes source tag and merges all of its usages, suggestions and implications to the
+    /// target tag. (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.merge_tags` for parameters and return type
+    pub async fn merge_tags(
+        &self,
+        remove_tag: String,
+        remove_tag_version: u32,
+        merge_to_tag: String,
+        merge_to_version: u32,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<TagResource> {
+        in_runtime(self.core.merge_tags(
+            remove_tag,
+            remove_tag_version,
+            merge_to_tag,
+            merge_to_version,
+            fields,
+        ))
+        .await
+    }
+
+    #[pyo3(signature = (name))]
+    /// Lists siblings of given tag, e.g. tags that were used in the same posts as the given tag.
+    /// (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_tag_siblings` for parameters and return type
+    pub async fn get_tag_siblings(&self, name: String) -> PyResult<Vec<TagSibling>> {
+        in_runtime(self.core.get_tag_siblings(name)).await
+    }
+
+    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
+    /// Lists the posts currently available on the site (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_posts` for parameters and return type
+    pub async fn list_posts(
+        &self,
+        query: Option<Vec<QueryToken>>,
+        fields: Option<Vec<String>>,
+        limit: Option<u32>,
+        offset: Option<u32>,
+    ) -> PyResult<PyPagedSearchResult> {
+        in_runtime(self.core.list_posts(query, fields, limit, offset)).await
+    }
+
+    #[pyo3(signature = (url=None, upload_token=None, file_path=None, thumbnail_path=None, tags=None, safety=None, source=None,
+            relations=None, notes=None, flags=None, anonymous=None, fields=None))]
+    #[allow(clippy::too_many_arguments)]
+    /// Create a new post using one of three image sources (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_post` for parameters and return type
+    pub async fn create_post(
+        &self,
+        url: Option<String>,
+        upload_token: Option<String>,
+        file_path: Option<PathBuf>,
+        thumbnail_path: Option<PathBuf>,
+        tags: Option<Vec<String>>,
+        safety: Option<PostSafety>,
+        source: Option<String>,
+        relations: Option<Vec<u32>>,
+        notes: Option<Vec<NoteResource>>,
+        flags: Option<Vec<String>>,
+        anonymous: Option<bool>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PostResource> {
+        in_runtime(self.core.create_post(
+            url,
+            upload_token,
+            file_path,
+            thumbnail_path,
+            tags,
+            safety,
+            source,
+            relations,
+            notes,
+            flags,
+            anonymous,
+            fields,
+        ))
+        .await
+    }
+
+    #[pyo3(signature = (post_id, post_version, url=None, token=None, file_path=None,
+        thumbnail_path=None, tags=None, safety=None, source=None, relations=None, notes=None,
+        flags=None, fields=None))]
+    #[allow(clippy::too_many_arguments)]
+    /// Updates an existing post (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_post` for parameters and return type
+    pub async fn update_post(
+        &self,
+        post_id: u32,
+        post_version: u32,
+        url: Option<String>,
+        token: Option<String>,
+        file_path: Option<PathBuf>,
+        thumbnail_path: Option<PathBuf>,
+        tags: Option<Vec<String>>,
+        safety: Option<PostSafety>,
+        source: Option<String>,
+        relations: Option<Vec<u32>>,
+        notes: Option<Vec<NoteResource>>,
+        flags: Option<Vec<String>>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PostResource> {
+        in_runtime(self.core.update_post(
+            post_id,
+            post_version,
+            url,
+            token,
+            file_path,
+            thumbnail_path,
+            tags,
+            safety,
+            source,
+            relations,
+            notes,
+            flags,
+            fields,
+        ))
+        .await
+    }
+
+    #[pyo3(signature = (post_id))]
+    /// Downloads the given post's image as a byte array (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_image_bytes` for parameters and return type
+    pub async fn get_image_bytes(&self, post_id: u32) -> PyResult<Vec<u8>> {
+        in_runtime(self.core.get_image_bytes(post_id)).await
+    }
+
+    #[pyo3(signature = (post_id, file_path))]
+    /// Downloads the given post's image to a path on the filesystem
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.download_image_to_path` for parameters and return type
+    pub async fn download_image_to_path(&self, post_id: u32, file_path: PathBuf) -> PyResult<()> {
+        in_runtime(self.core.download_image_to_path(post_id, file_path)).await
+    }
+
+    #[pyo3(signature = (post_id))]
+    /// Downloads the given post's thumbnail as a byte array
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_thumbnail_bytes` for parameters and return type
+    pub async fn get_thumbnail_bytes<'py>(&self, post_id: u32) -> PyResult<Vec<u8>> {
+        in_runtime(self.core.get_thumbnail_bytes(post_id)).await
+    }
+
+    #[pyo3(signature = (post_id, file_path))]
+    /// Downloads the given post's thumbnail to a path on the filesystem
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.` for parameters and return type
+    pub async fn download_thumbnail_to_path(
+        &self,
+        post_id: u32,
+        file_path: PathBuf,
+    ) -> PyResult<()> {
+        in_runtime(self.core.download_thumbnail_to_path(post_id, file_path)).await
+    }
+
+    #[pyo3(signature = (image_path))]
+    /// Reverse image searches for an image from the filesystem (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.reverse_image_search` for parameters and return type
+    pub async fn reverse_image_search(&self, image_path: PathBuf) -> PyResult<ImageSearchResult> {
+        in_runtime(self.core.reverse_image_search(image_path)).await
+    }
+
+    #[pyo3(signature = (image_path))]
+    /// Searches for an *exact* image match of an image from the filesystem (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.post_for_image` for parameters and return type
+    pub async fn post_for_image(&self, image_path: PathBuf) -> PyResult<Option<PostResource>> {
+        in_runtime(self.core.post_for_image(image_path)).await
+    }
+
+    #[pyo3(signature = (post_id, fields=None))]
+    /// Fetches an individual post by its post ID (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_post` for parameters and return type
+    pub async fn get_post(
+        &self,
+        post_id: u32,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PostResource> {
+        in_runtime(self.core.get_post(post_id, fields)).await
+    }
+
+    /// Fetches posts from *around* the given post ID. That means the post before and after,
+    //  if they exist. (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_around_post` for parameters and return type
+    pub async fn get_around_post(&self, post_id: u32) -> PyResult<AroundPostResult> {
+        in_runtime(self.core.get_around_post(post_id)).await
+    }
+
+    /// Deletes a post by its ID (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_post` for parameters and return type
+    pub async fn delete_post(&self, post_id: u32, version: u32) -> PyResult<()> {
+        in_runtime(self.core.delete_post(post_id, version)).await
+    }
+
+    #[pyo3(signature = (remove_post, remove_post_version, merge_to_post,
+        merge_to_version, replace_post_content=false, fields=None))]
+    /// Removes source post and merges all of its tags, relations, scores, favorites and comments to
+    /// the target post (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.merge_post` for parameters and return type
+    pub async fn merge_post(
+        &self,
+        remove_post: u32,
+        remove_post_version: u32,
+        merge_to_post: u32,
+        merge_to_version: u32,
+        replace_post_content: bool,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PostResource> {
+        in_runtime(self.core.merge_post(
+            remove_post,
+            remove_post_version,
+            merge_to_post,
+            merge_to_version,
+            replace_post_content,
+            fields,
+        ))
+        .await
+    }
+
+    #[pyo3(signature = (post_id, rating, fields=None))]
+    /// Updates score of authenticated user for given post. Valid scores are -1, 0 and 1.
+    /// (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.rate_post` for parameters and return type
+    pub async fn rate_post(
+        &self,
+        post_id: u32,
+        rating: i8,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PostResource> {
+        in_runtime(self.core.rate_post(post_id, rating, fields)).await
+    }
+
+    #[pyo3(signature = (post_id, fields=None))]
+    /// Marks the post as favorite for the current user (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.favorite_post` for parameters and return type
+    pub async fn favorite_post(
+        &self,
+        post_id: u32,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PostResource> {
+        in_runtime(self.core.favorite_post(post_id, fields)).await
+    }
+
+    #[pyo3(signature = (post_id, fields=None))]
+    /// Unmarks the post as favorite for the current user (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.unfavorite_post` for parameters and return type
+    pub async fn unfavorite_post(
+        &self,
+        post_id: u32,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PostResource> {
+        in_runtime(self.core.unfavorite_post(post_id, fields)).await
+    }
+
+    #[pyo3(signature = (fields=None))]
+    /// Retrieves the post that is currently featured on the main page (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_featured_post` for parameters and return type
+    pub async fn get_featured_post(
+        &self,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<Option<PostResource>> {
+        in_runtime(self.core.get_featured_post(fields)).await
+    }
+
+    #[pyo3(signature = (post_id, fields=None))]
+    /// Features a post on the main page (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.set_featured_post` for parameters and return type
+    pub async fn set_featured_post(
+        &self,
+        post_id: u32,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PostResource> {
+        in_runtime(self.core.set_featured_post(post_id, fields)).await
+    }
+
+    #[pyo3(signature = (fields=None))]
+    /// Lists all pool categories (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_pool_categories` for parameters and return type
+    pub async fn list_pool_categories(
+        &self,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<Vec<PoolCategoryResource>> {
+        in_runtime(self.core.list_pool_categories(fields)).await
+    }
+
+    #[pyo3(signature = (name, color=None, fields=None))]
+    /// Creates a new pool category using specified parameters (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_pool_category` for parameters and return type
+    pub async fn create_pool_category(
+        &self,
+        name: String,
+        color: Option<String>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PoolCategoryResource> {
+        in_runtime(self.core.create_pool_category(name, color, fields)).await
+    }
+
+    #[pyo3(signature = (name, version, new_name=None, color=None, fields=None))]
+    /// Updates an existing tag category using specified parameters (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_pool_category` for parameters and return type
+    pub async fn update_pool_category(
+        &self,
+        name: String,
+        version: u32,
+        new_name: Option<String>,
+        color: Option<String>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PoolCategoryResource> {
+        in_runtime(self.core.update_pool_category(name, version, new_name, color, fields)).await
+    }
+
+    #[pyo3(signature = (name, fields=None))]
+    /// Fetches an existing pool category (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_pool_category` for parameters and return type
+    pub async fn get_pool_category(
+        &self,
+        name: String,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PoolCategoryResource> {
+        in_runtime(self.core.get_pool_category(name, fields)).await
+    }
+
+    /// Deletes existing pool category (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_pool_category` for parameters and return type
+    pub async fn delete_pool_category(&self, name: String, version: u32) -> PyResult<()> {
+        in_runtime(self.core.delete_pool_category(name, version)).await
+    }
+
+    #[pyo3(signature = (name, fields=None))]
+    /// Sets given pool category as default (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.set_default_pool_category` for parameters and return type
+    pub async fn set_default_pool_category(
+        &self,
+        name: String,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PoolCategoryResource> {
+        in_runtime(self.core.set_default_pool_category(name, fields)).await
+    }
+
+    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
+    /// List the post pools currently available on the site (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_pools` for parameters and return type
+    pub async fn list_pools(
+        &self,
+        query: Option<Vec<QueryToken>>,
+        fields: Option<Vec<String>>,
+        limit: Option<u32>,
+        offset: Option<u32>,
+    ) -> PyResult<PyPagedSearchResult> {
+        in_runtime(self.core.list_pools(query, fields, limit, offset)).await
+    }
+
+    #[pyo3(signature = (names, category=None, description=None, posts=None, fields=None))]
+    /// Creates a new pool using specified parameters (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_pool` for parameters and return type
+    pub async fn create_pool<'py>(
+        &self,
+        names: Py<PyAny>,
+        category: Option<String>,
+        description: Option<String>,
+        posts: Option<Vec<u32>>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PoolResource> {
+        in_runtime(self.core.create_pool(names, category, description, posts, fields)).await
+    }
+
+    #[pyo3(signature = (names, category=None, description=None, fields=None))]
+    /// Creates several pools concurrently (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_pools` for parameters and return type
+    pub async fn create_pools(
+        &self,
+        names: Vec<Py<PyAny>>,
+        category: Option<String>,
+        description: Option<String>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<Vec<PoolResource>> {
+        in_runtime(self.core.create_pools(names, category, description, fields)).await
+    }
+
+    #[pyo3(signature = (pool_id, version, new_names=None, category=None, description=None,
+        posts=None, fields=None))]
+    #[allow(clippy::too_many_arguments)]
+    /// Updates an existing pool using specified parameters (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_pool` for parameters and return type
+    pub async fn update_pool(
+        &self,
+        pool_id: u32,
+        version: u32,
+        new_names: Option<Vec<String>>,
+        category: Option<String>,
+        description: Option<String>,
+        posts: Option<Vec<u32>>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PoolResource> {
+        in_runtime(self.core.update_pool(
+            pool_id,
+            version,
+            new_names,
+            category,
+            description,
+            posts,
+            fields,
+        ))
+        .await
+    }
+
+    #[pyo3(signature = (pool_id, fields=None))]
+    /// Retrieves information about an existing pool (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_pool` for parameters and return type
+    pub async fn get_pool(
+        &self,
+        pool_id: u32,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PoolResource> {
+        in_runtime(self.core.get_pool(pool_id, fields)).await
+    }
+
+    /// Deletes existing pool (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_pool` for parameters and return type
+    pub async fn delete_pool(&self, pool_id: u32, version: u32) -> PyResult<()> {
+        in_runtime(self.core.delete_pool(pool_id, version)).await
+    }
+
+    #[pyo3(signature = (remove_pool, remove_pool_version, merge_to_pool, merge_to_version, fields=None))]
+    /// Removes source pool and merges all of its posts with the target pool. (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.merge_pools` for parameters and return type
+    pub async fn merge_pools(
+        &self,
+        remove_pool: u32,
+        remove_pool_version: u32,
+        merge_to_pool: u32,
+        merge_to_version: u32,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<PoolResource> {
+        in_runtime(self.core.merge_pools(
+            remove_pool,
+            remove_pool_version,
+            merge_to_pool,
+            merge_to_version,
+            fields,
+        ))
+        .await
+    }
+
+    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
+    /// List the comments currently available on the site (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_comments` for parameters and return type
+    pub async fn list_comments(
+        &self,
+        query: Option<Vec<QueryToken>>,
+        fields: Option<Vec<String>>,
+        limit: Option<u32>,
+        offset: Option<u32>,
+    ) -> PyResult<PyPagedSearchResult> {
+        in_runtime(self.core.list_comments(query, fields, limit, offset)).await
+    }
+
+    #[pyo3(signature = (text, post_id, fields=None))]
+    /// Creates a new comment under a given post (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_comment` for parameters and return type
+    pub async fn create_comment(
+        &self,
+        text: String,
+        post_id: u32,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<CommentResource> {
+        in_runtime(self.core.create_comment(text, post_id, fields)).await
+    }
+
+    #[pyo3(signature = (comment_id, version, text, fields=None))]
+    /// Updates an existing comment with new text (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_comment` for parameters and return type
+    pub async fn update_comment(
+        &self,
+        comment_id: u32,
+        version: u32,
+        text: String,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<CommentResource> {
+        in_runtime(self.core.update_comment(comment_id, version, text, fields)).await
+    }
+
+    #[pyo3(signature = (comment_id, fields=None))]
+    /// Fetches an existing comment (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_comment` for parameters and return type
+    pub async fn get_comment(
+        &self,
+        comment_id: u32,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<CommentResource> {
+        in_runtime(self.core.get_comment(comment_id, fields)).await
+    }
+
+    /// Deletes an existing comment (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_comment` for parameters and return type
+    pub async fn delete_comment(&self, comment_id: u32, version: u32) -> PyResult<()> {
+        in_runtime(self.core.delete_comment(comment_id, version)).await
+    }
+
+    #[pyo3(signature = (comment_id, rating, fields=None))]
+    /// Updates score of authenticated user for given comment. Valid scores are -1, 0 and 1.
+    /// (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.rate_comment` for parameters and return type
+    pub async fn rate_comment(
+        &self,
+        comment_id: u32,
+        rating: i8,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<CommentResource> {
+        in_runtime(self.core.rate_comment(comment_id, rating, fields)).await
+    }
+
+    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
+    /// List the users currently registered on the site (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_users` for parameters and return type
+    pub async fn list_users(
+        &self,
+        query: Option<Vec<QueryToken>>,
+        fields: Option<Vec<String>>,
+        limit: Option<u32>,
+        offset: Option<u32>,
+    ) -> PyResult<PyPagedSearchResult> {
+        in_runtime(self.core.list_users(query, fields, limit, offset)).await
+    }
+
+    #[pyo3(signature = (name, password, rank=None, avatar_path=None, fields=None))]
+    /// Creates a new user using specified parameters (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_user` for parameters and return type
+    pub async fn create_user(
+        &self,
+        name: String,
+        password: String,
+        rank: Option<UserRank>,
+        avatar_path: Option<PathBuf>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<UserResource> {
+        in_runtime(self.core.create_user(name, password, rank, avatar_path, fields)).await
+    }
+
+    #[pyo3(signature = (name, version, new_name=None, password=None, rank=None, avatar_path=None, fields=None))]
+    #[allow(clippy::too_many_arguments)]
+    /// Updates an existing user using specified parameters (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update` for parameters and return type
+    pub async fn update_user(
+        &self,
+        name: String,
+        version: u32,
+        new_name: Option<String>,
+        password: Option<String>,
+        rank: Option<UserRank>,
+        avatar_path: Option<PathBuf>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<UserResource> {
+        in_runtime(self.core.update_user(
+            name,
+            version,
+            new_name,
+            password,
+            rank,
+            avatar_path,
+            fields,
+        ))
+        .await
+    }
+
+    #[pyo3(signature = (user_name, fields=None))]
+    /// Retrieves information about an existing user (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_user` for parameters and return type
+    pub async fn get_user(
+        &self,
+        user_name: String,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<UserResource> {
+        in_runtime(self.core.get_user(user_name, fields)).await
+    }
+
+    /// Deletes an existing user (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_user` for parameters and return type
+    pub async fn delete_user(&self, user_name: String, version: u32) -> PyResult<()> {
+        in_runtime(self.core.delete_user(user_name, version)).await
+    }
+
+    #[pyo3(signature = (user_name, fields=None))]
+    /// Fetches a list of the given user's auth tokens (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_user_tokens` for parameters and return type
+    pub async fn list_user_tokens(
+        &self,
+        user_name: String,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<Vec<UserAuthTokenResource>> {
+        in_runtime(self.core.list_user_tokens(user_name, fields)).await
+    }
+
+    #[pyo3(signature = (user_name, note=None, enabled=None, expiration_time=None, fields=None))]
+    /// Creates an auth token for the given user (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_user_token` for parameters and return type
+    pub async fn create_user_token(
+        &self,
+        user_name: String,
+        note: Option<String>,
+        enabled: Option<bool>,
+        expiration_time: Option<DateTime<Utc>>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<UserAuthTokenResource> {
+        in_runtime(self.core.create_user_token(
+            user_name,
+            note,
+            enabled,
+            expiration_time,
+            fields,
+        ))
+        .await
+    }
+
+    #[pyo3(signature = (user_name, token, version, enabled=None, note=None, expiration_time=None, fields=None))]
+    #[allow(clippy::too_many_arguments)]
+    /// Update a user's existing auth token (async version)
     ///
-    /// :see: :class:`~szurubooru_client.SzurubooruSyncClient` for supported parameters
-    pub fn new(
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_user_token` for parameters and return type
+    pub async fn update_user_token(
+        &self,
+        user_name: String,
+        token: String,
+        version: u32,
+        enabled: Option<bool>,
+        note: Option<String>,
+        expiration_time: Option<DateTime<Utc>>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<UserAuthTokenResource> {
+        in_runtime(self.core.update_user_token(
+            user_name,
+            token,
+            version,
+            enabled,
+            note,
+            expiration_time,
+            fields,
+        ))
+        .await
+    }
+
+    /// Deletes an existing user auth token (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_user_token` for parameters and return type
+    pub async fn delete_user_token(
+        &self,
+        user_name: String,
+        token: String,
+        version: u32,
+    ) -> PyResult<()> {
+        in_runtime(self.core.delete_user_token(user_name, token, version)).await
+    }
+
+    /// Start a password reset request (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.password_reset_request` for parameters and return type
+    pub async fn password_reset_request(&self, email_or_name: String) -> PyResult<()> {
+        in_runtime(self.core.password_reset_request(email_or_name)).await
+    }
+
+    /// Confirm a password reset request (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.password_reset_confirm` for parameters and return type
+    pub async fn password_reset_confirm(
+        &self,
+        email_or_name: String,
+        reset_token: String,
+    ) -> PyResult<String> {
+        in_runtime(self.core.password_reset_confirm(email_or_name, reset_token)).await
+    }
+
+    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
+    /// List the snapshots currently available on the site (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_snapshots` for parameters and return type
+    pub async fn list_snapshots(
+        &self,
+        query: Option<Vec<QueryToken>>,
+        fields: Option<Vec<String>>,
+        limit: Option<u32>,
+        offset: Option<u32>,
+    ) -> PyResult<PyPagedSearchResult> {
+        in_runtime(self.core.list_snapshots(query, fields, limit, offset)).await
+    }
+
+    /// Retrieves simple statistics. ``featured_post`` is ``None`` if there is no featured post yet.
+    /// ``server_time`` is pretty much the same as the Date HTTP
+    /// field, only formatted in a manner consistent with other dates. Values in config key are
+    /// taken directly from the server config, with the exception of privilege array keys being
+    /// converted to lower camel case to match the API convention.
+    ///
+    /// (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.global_info` for parameters and return type
+    pub async fn global_info(&self) -> PyResult<GlobalInfo> {
+        in_runtime(self.core.global_info()).await
+    }
+
+    /// Puts a file from a given file path in temporary storage and assigns it a token that can be
+    /// used in other requests. (async version)
+    ///
+    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.upload_temporary_file` for parameters and return type
+    pub async fn upload_temporary_file(&self, file_path: PathBuf) -> PyResult<String> {
+        in_runtime(self.core.upload_temporary_file(file_path)).await
+    }
+}
+
+impl ClientCore {
+    pub(crate) fn new(
         host: String,
         username: Option<String>,
         token: Option<String>,
         password: Option<String>,
         allow_insecure: Option<bool>,
+        cache_categories: Option<bool>,
     ) -> PyResult<Self> {
         let allow_insecure = allow_insecure.unwrap_or(false);
 
-        match (username, token, password) {
+        let client = match (username, token, password) {
             (Some(u), Some(t), None) => {
-                let client = SzurubooruClient::new_with_token(&host, &u, &t, allow_insecure)?;
-                Ok(PythonAsyncClient { client })
+                SzurubooruClient::new_with_token(&host, &u, &t, allow_insecure)?
             }
             (Some(u), None, Some(p)) => {
-                let client = SzurubooruClient::new_with_basic_auth(&host, &u, &p, allow_insecure)?;
-                Ok(PythonAsyncClient { client })
+                SzurubooruClient::new_with_basic_auth(&host, &u, &p, allow_insecure)?
             }
-            (None, None, None) => {
-                let client = SzurubooruClient::new_anonymous(&host, allow_insecure)?;
-                Ok(PythonAsyncClient { client })
+            (None, None, None) => SzurubooruClient::new_anonymous(&host, allow_insecure)?,
+            _ => {
+                return Err(PyRuntimeError::new_err(
+                    "(Username and Token) or (Username and Password) must be provided",
+                ))
             }
-            _ => Err(PyRuntimeError::new_err(
-                "(Username and Token) or (Username and Password) must be provided",
-            )),
-        }
+        };
+        let category_cache = cache_categories
+            .unwrap_or(false)
+            .then(|| Mutex::new(CategoryCache::default()));
+        Ok(ClientCore {
+            client,
+            category_cache,
+        })
     }
 
-    #[pyo3(signature = (fields=None))]
-    /// List the available tag categories (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_tag_categories` for parameters and return type
-    pub async fn list_tag_categories(
+    pub(crate) async fn list_tag_categories(
         &self,
         fields: Option<Vec<String>>,
     ) -> PyResult<Vec<TagCategoryResource>> {
-        let request = self.client.with_optional_fields(fields);
-        request
+        let mut generation = None;
+        if let Some(cache) = &self.category_cache {
+            let cache = cache.lock().unwrap();
+            if let Some(cached) = cache.tag_categories.get(&fields) {
+                return Ok(cached.clone());
+            }
+            generation = Some(cache.tag_generation);
+        }
+        let request = self.client.with_optional_fields(fields.clone());
+        let results = request
             .list_tag_categories()
             .await
-            .map(|ltc| ltc.results)
-            .map_err(Into::into)
+            .map(|ltc| ltc.results)?;
+        if let Some(cache) = &self.category_cache {
+            let mut cache = cache.lock().unwrap();
+            if generation == Some(cache.tag_generation) {
+                cache.tag_categories.insert(fields, results.clone());
+            }
+        }
+        Ok(results)
     }
 
-    #[pyo3(signature = (name, color=None, order=None, fields=None))]
-    /// Creates a new tag category using the specified parameters (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_tag_category` for parameters and return type
-    pub async fn create_tag_category(
+    pub(crate) async fn create_tag_category(
         &self,
         name: String,
         color: Option<String>,
@@ -86,18 +1056,17 @@ impl PythonAsyncClient {
             cutagcat.order(order);
         }
         let cutagcat = cutagcat.build()?;
-        self.client
+        let result = self
+            .client
             .with_optional_fields(fields)
             .create_tag_category(&cutagcat)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (name, version, new_name=None, color=None, order=None, fields=None))]
-    /// Updates an existing tag category (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_tag_category` for parameters and return type
-    pub async fn update_tag_category(
+    pub(crate) async fn update_tag_category(
         &self,
         name: String,
         version: u32,
@@ -121,17 +1090,15 @@ impl PythonAsyncClient {
 
         let cutag = cutag.build()?;
         let request = self.client.with_optional_fields(fields);
-        request
+        let result = request
             .update_tag_category(name, &cutag)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (name, fields=None))]
-    /// Fetches a tag category by name (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_tag_category` for parameters and return type
-    pub async fn get_tag_category(
+    pub(crate) async fn get_tag_category(
         &self,
         name: String,
         fields: Option<Vec<String>>,
@@ -143,33 +1110,29 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (name, version))]
-    /// Deletes a tag category (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_tag_category` for parameters and return type
-    pub async fn delete_tag_category(&self, name: String, version: u32) -> PyResult<()> {
-        self.client
+    pub(crate) async fn delete_tag_category(&self, name: String, version: u32) -> PyResult<()> {
+        let result = self
+            .client
             .request()
             .delete_tag_category(name, version)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (name))]
-    /// Sets the default tag category for the site (async version)
-    pub async fn set_default_tag_category(&self, name: String) -> PyResult<()> {
-        self.client
+    pub(crate) async fn set_default_tag_category(&self, name: String) -> PyResult<()> {
+        let result = self
+            .client
             .request()
             .set_default_tag_category(name)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
-    /// List the tags currently available on the site (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_tags` for parameters and return type
-    pub async fn list_tags(
+    pub(crate) async fn list_tags(
         &self,
         query: Option<Vec<QueryToken>>,
         fields: Option<Vec<String>>,
@@ -186,11 +1149,7 @@ impl PythonAsyncClient {
             .map(Into::into)
     }
 
-    #[pyo3(signature = (names, category=None, description=None, implications=None, suggestions=None, fields=None))]
-    /// Creating a new tag (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_tag` for parameters and return type
-    pub async fn create_tag(
+    pub(crate) async fn create_tag(
         &self,
         names: Py<PyAny>,
         category: Option<String>,
@@ -226,19 +1185,17 @@ impl PythonAsyncClient {
             cubuild.suggestions(s);
         }
         let tag_build = cubuild.build()?;
-        self.client
+        let result = self
+            .client
             .with_optional_fields(fields)
             .create_tag(&tag_build)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (name, version, names=None, category=None, description=None, implications=None, suggestions=None, fields=None))]
-    #[allow(clippy::too_many_arguments)]
-    /// Updates an existing tag (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_tag` for parameters and return type
-    pub async fn update_tag(
+    pub(crate) async fn update_tag(
         &self,
         name: String,
         version: u32,
@@ -278,18 +1235,17 @@ impl PythonAsyncClient {
             cubuild.suggestions(s);
         }
         let tag_build = cubuild.build()?;
-        self.client
+        let result = self
+            .client
             .with_optional_fields(fields)
             .update_tag(name, &tag_build)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (name, fields=None))]
-    /// Fetches an existing tag (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_tag` for parameters and return type
-    pub async fn get_tag(
+    pub(crate) async fn get_tag(
         &self,
         name: String,
         fields: Option<Vec<String>>,
@@ -301,24 +1257,18 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (name, version))]
-    /// Deletes an existing tag (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_tag` for parameters and return type
-    pub async fn delete_tag(&self, name: String, version: u32) -> PyResult<()> {
-        self.client
+    pub(crate) async fn delete_tag(&self, name: String, version: u32) -> PyResult<()> {
+        let result = self
+            .client
             .request()
             .delete_tag(name, version)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (remove_tag, remove_tag_version, merge_to_tag, merge_to_version, fields=None))]
-    /// Removes source tag and merges all of its usages, suggestions and implications to the
-    /// target tag. (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.merge_tags` for parameters and return type
-    pub async fn merge_tags(
+    pub(crate) async fn merge_tags(
         &self,
         remove_tag: String,
         remove_tag_version: u32,
@@ -332,19 +1282,17 @@ impl PythonAsyncClient {
             .merge_to_version(merge_to_version)
             .merge_to_tag(merge_to_tag)
             .build()?;
-        self.client
+        let result = self
+            .client
             .with_optional_fields(fields)
             .merge_tags(&mtags)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (name))]
-    /// Lists siblings of given tag, e.g. tags that were used in the same posts as the given tag.
-    /// (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_tag_siblings` for parameters and return type
-    pub async fn get_tag_siblings(&self, name: String) -> PyResult<Vec<TagSibling>> {
+    pub(crate) async fn get_tag_siblings(&self, name: String) -> PyResult<Vec<TagSibling>> {
         self.client
             .request()
             .get_tag_siblings(name)
@@ -353,11 +1301,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
-    /// Lists the posts currently available on the site (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_posts` for parameters and return type
-    pub async fn list_posts(
+    pub(crate) async fn list_posts(
         &self,
         query: Option<Vec<QueryToken>>,
         fields: Option<Vec<String>>,
@@ -374,13 +1318,7 @@ impl PythonAsyncClient {
             .map(Into::into)
     }
 
-    #[pyo3(signature = (url=None, upload_token=None, file_path=None, thumbnail_path=None, tags=None, safety=None, source=None,
-            relations=None, notes=None, flags=None, anonymous=None, fields=None))]
-    #[allow(clippy::too_many_arguments)]
-    /// Create a new post using one of three image sources (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_post` for parameters and return type
-    pub async fn create_post(
+    pub(crate) async fn create_post(
         &self,
         url: Option<String>,
         upload_token: Option<String>,
@@ -418,7 +1356,7 @@ impl PythonAsyncClient {
             cupost.anonymous(anonymous);
         }
 
-        if let Some(token) = upload_token {
+        let result = if let Some(token) = upload_token {
             cupost.content_token(token);
             let cupost = cupost.build()?;
             self.client
@@ -445,17 +1383,12 @@ impl PythonAsyncClient {
             Err(PyRuntimeError::new_err(
                 "One of url, token or file must be specified",
             ))
-        }
+        };
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (post_id, post_version, url=None, token=None, file_path=None,
-        thumbnail_path=None, tags=None, safety=None, source=None, relations=None, notes=None,
-        flags=None, fields=None))]
-    #[allow(clippy::too_many_arguments)]
-    /// Updates an existing post (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_post` for parameters and return type
-    pub async fn update_post(
+    pub(crate) async fn update_post(
         &self,
         post_id: u32,
         post_version: u32,
@@ -492,7 +1425,7 @@ impl PythonAsyncClient {
             cupost.flags(flags);
         }
 
-        if let Some(token) = token {
+        let result = if let Some(token) = token {
             cupost.content_token(token);
             let cupost = cupost.build()?;
             self.client
@@ -522,14 +1455,12 @@ impl PythonAsyncClient {
                 .update_post(post_id, &cupost)
                 .await
                 .map_err(Into::into)
-        }
+        };
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (post_id))]
-    /// Downloads the given post's image as a byte array (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_image_bytes` for parameters and return type
-    pub async fn get_image_bytes(&self, post_id: u32) -> PyResult<Vec<u8>> {
+    pub(crate) async fn get_image_bytes(&self, post_id: u32) -> PyResult<Vec<u8>> {
         let bytes = self
             .client
             .request()
@@ -539,11 +1470,7 @@ impl PythonAsyncClient {
         Ok(bytes)
     }
 
-    #[pyo3(signature = (post_id, file_path))]
-    /// Downloads the given post's image to a path on the filesystem
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.download_image_to_path` for parameters and return type
-    pub async fn download_image_to_path(&self, post_id: u32, file_path: PathBuf) -> PyResult<()> {
+    pub(crate) async fn download_image_to_path(&self, post_id: u32, file_path: PathBuf) -> PyResult<()> {
         self.client
             .request()
             .download_image_to_path(post_id, file_path)
@@ -551,11 +1478,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (post_id))]
-    /// Downloads the given post's thumbnail as a byte array
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_thumbnail_bytes` for parameters and return type
-    pub async fn get_thumbnail_bytes<'py>(&self, post_id: u32) -> PyResult<Vec<u8>> {
+    pub(crate) async fn get_thumbnail_bytes(&self, post_id: u32) -> PyResult<Vec<u8>> {
         let bytes = self
             .client
             .request()
@@ -565,11 +1488,7 @@ impl PythonAsyncClient {
         Ok(bytes)
     }
 
-    #[pyo3(signature = (post_id, file_path))]
-    /// Downloads the given post's thumbnail to a path on the filesystem
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.` for parameters and return type
-    pub async fn download_thumbnail_to_path(
+    pub(crate) async fn download_thumbnail_to_path(
         &self,
         post_id: u32,
         file_path: PathBuf,
@@ -581,11 +1500,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (image_path))]
-    /// Reverse image searches for an image from the filesystem (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.reverse_image_search` for parameters and return type
-    pub async fn reverse_image_search(&self, image_path: PathBuf) -> PyResult<ImageSearchResult> {
+    pub(crate) async fn reverse_image_search(&self, image_path: PathBuf) -> PyResult<ImageSearchResult> {
         self.client
             .request()
             .reverse_search_file_path(image_path)
@@ -593,11 +1508,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (image_path))]
-    /// Searches for an *exact* image match of an image from the filesystem (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.post_for_image` for parameters and return type
-    pub async fn post_for_image(&self, image_path: PathBuf) -> PyResult<Option<PostResource>> {
+    pub(crate) async fn post_for_image(&self, image_path: PathBuf) -> PyResult<Option<PostResource>> {
         self.client
             .request()
             .post_for_file_path(image_path)
@@ -605,11 +1516,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (post_id, fields=None))]
-    /// Fetches an individual post by its post ID (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_post` for parameters and return type
-    pub async fn get_post(
+    pub(crate) async fn get_post(
         &self,
         post_id: u32,
         fields: Option<Vec<String>>,
@@ -621,36 +1528,26 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    /// Fetches posts from *around* the given post ID. That means the post before and after,
-    //  if they exist. (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_around_post` for parameters and return type
-    pub async fn get_around_post(&self, post_id: u32) -> PyResult<AroundPostResult> {
+    pub(crate) async fn get_around_post(&self, post_id: u32) -> PyResult<AroundPostResult> {
         self.client
             .request()
             .get_around_post(post_id)
             .await
-            .map_err(Into::into)
-    }
-
-    /// Deletes a post by its ID (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_post` for parameters and return type
-    pub async fn delete_post(&self, post_id: u32, version: u32) -> PyResult<()> {
-        self.client
+            .map_err(Into::into)
+    }
+
+    pub(crate) async fn delete_post(&self, post_id: u32, version: u32) -> PyResult<()> {
+        let result = self
+            .client
             .request()
             .delete_post(post_id, version)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (remove_post, remove_post_version, merge_to_post,
-        merge_to_version, replace_post_content=false, fields=None))]
-    /// Removes source post and merges all of its tags, relations, scores, favorites and comments to
-    /// the target post (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.merge_post` for parameters and return type
-    pub async fn merge_post(
+    pub(crate) async fn merge_post(
         &self,
         remove_post: u32,
         remove_post_version: u32,
@@ -666,19 +1563,17 @@ impl PythonAsyncClient {
             .merge_to_post(merge_to_post)
             .replace_post_content(replace_post_content)
             .build()?;
-        self.client
+        let result = self
+            .client
             .with_optional_fields(fields)
             .merge_post(&mpost)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_tag_categories();
+        result
     }
 
-    #[pyo3(signature = (post_id, rating, fields=None))]
-    /// Updates score of authenticated user for given post. Valid scores are -1, 0 and 1.
-    /// (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.rate_post` for parameters and return type
-    pub async fn rate_post(
+    pub(crate) async fn rate_post(
         &self,
         post_id: u32,
         rating: i8,
@@ -695,11 +1590,7 @@ impl PythonAsyncClient {
         }
     }
 
-    #[pyo3(signature = (post_id, fields=None))]
-    /// Marks the post as favorite for the current user (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.favorite_post` for parameters and return type
-    pub async fn favorite_post(
+    pub(crate) async fn favorite_post(
         &self,
         post_id: u32,
         fields: Option<Vec<String>>,
@@ -711,11 +1602,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (post_id, fields=None))]
-    /// Unmarks the post as favorite for the current user (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.unfavorite_post` for parameters and return type
-    pub async fn unfavorite_post(
+    pub(crate) async fn unfavorite_post(
         &self,
         post_id: u32,
         fields: Option<Vec<String>>,
@@ -727,11 +1614,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (fields=None))]
-    /// Retrieves the post that is currently featured on the main page (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_featured_post` for parameters and return type
-    pub async fn get_featured_post(
+    pub(crate) async fn get_featured_post(
         &self,
         fields: Option<Vec<String>>,
     ) -> PyResult<Option<PostResource>> {
@@ -742,11 +1625,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (post_id, fields=None))]
-    /// Features a post on the main page (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.set_featured_post` for parameters and return type
-    pub async fn set_featured_post(
+    pub(crate) async fn set_featured_post(
         &self,
         post_id: u32,
         fields: Option<Vec<String>>,
@@ -758,27 +1637,34 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (fields=None))]
-    /// Lists all pool categories (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_pool_categories` for parameters and return type
-    pub async fn list_pool_categories(
+    pub(crate) async fn list_pool_categories(
         &self,
         fields: Option<Vec<String>>,
     ) -> PyResult<Vec<PoolCategoryResource>> {
-        self.client
-            .with_optional_fields(fields)
+        let mut generation = None;
+        if let Some(cache) = &self.category_cache {
+            let cache = cache.lock().unwrap();
+            if let Some(cached) = cache.pool_categories.get(&fields) {
+                return Ok(cached.clone());
+            }
+            generation = Some(cache.pool_generation);
+        }
+        let results = self
+            .client
+            .with_optional_fields(fields.clone())
             .list_pool_categories()
             .await
-            .map_err(Into::into)
-            .map(|pc| pc.results)
+            .map(|pc| pc.results)?;
+        if let Some(cache) = &self.category_cache {
+            let mut cache = cache.lock().unwrap();
+            if generation == Some(cache.pool_generation) {
+                cache.pool_categories.insert(fields, results.clone());
+            }
+        }
+        Ok(results)
     }
 
-    #[pyo3(signature = (name, color=None, fields=None))]
-    /// Creates a new pool category using specified parameters (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_pool_category` for parameters and return type
-    pub async fn create_pool_category(
+    pub(crate) async fn create_pool_category(
         &self,
         name: String,
         color: Option<String>,
@@ -790,18 +1676,17 @@ impl PythonAsyncClient {
             pc.color(color);
         }
         let pc = pc.build()?;
-        self.client
+        let result = self
+            .client
             .with_optional_fields(fields)
             .create_pool_category(&pc)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_pool_categories();
+        result
     }
 
-    #[pyo3(signature = (name, version, new_name=None, color=None, fields=None))]
-    /// Updates an existing tag category using specified parameters (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_pool_category` for parameters and return type
-    pub async fn update_pool_category(
+    pub(crate) async fn update_pool_category(
         &self,
         name: String,
         version: u32,
@@ -818,18 +1703,17 @@ impl PythonAsyncClient {
             pc.color(color);
         }
         let pc = pc.build()?;
-        self.client
+        let result = self
+            .client
             .with_optional_fields(fields)
             .update_pool_category(name, &pc)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_pool_categories();
+        result
     }
 
-    #[pyo3(signature = (name, fields=None))]
-    /// Fetches an existing pool category (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_pool_category` for parameters and return type
-    pub async fn get_pool_category(
+    pub(crate) async fn get_pool_category(
         &self,
         name: String,
         fields: Option<Vec<String>>,
@@ -841,38 +1725,33 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    /// Deletes existing pool category (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_pool_category` for parameters and return type
-    pub async fn delete_pool_category(&self, name: String, version: u32) -> PyResult<()> {
-        self.client
+    pub(crate) async fn delete_pool_category(&self, name: String, version: u32) -> PyResult<()> {
+        let result = self
+            .client
             .request()
             .delete_pool_category(name, version)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_pool_categories();
+        result
     }
 
-    #[pyo3(signature = (name, fields=None))]
-    /// Sets given pool category as default (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.set_default_pool_category` for parameters and return type
-    pub async fn set_default_pool_category(
+    pub(crate) async fn set_default_pool_category(
         &self,
         name: String,
         fields: Option<Vec<String>>,
     ) -> PyResult<PoolCategoryResource> {
-        self.client
+        let result = self
+            .client
             .with_optional_fields(fields)
             .set_default_pool_category(name)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_pool_categories();
+        result
     }
 
-    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
-    /// List the post pools currently available on the site (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_pools` for parameters and return type
-    pub async fn list_pools(
+    pub(crate) async fn list_pools(
         &self,
         query: Option<Vec<QueryToken>>,
         fields: Option<Vec<String>>,
@@ -889,11 +1768,7 @@ impl PythonAsyncClient {
             .map(Into::into)
     }
 
-    #[pyo3(signature = (names, category=None, description=None, posts=None, fields=None))]
-    /// Creates a new pool using specified parameters (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_pool` for parameters and return type
-    pub async fn create_pool<'py>(
+    pub(crate) async fn create_pool(
         &self,
         names: Py<PyAny>,
         category: Option<String>,
@@ -925,20 +1800,80 @@ impl PythonAsyncClient {
             cupool.posts(posts);
         }
         let cupool = cupool.build()?;
-        self.client
+        let result = self
+            .client
             .with_optional_fields(fields)
             .create_pool(&cupool)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_pool_categories();
+        result
     }
 
-    #[pyo3(signature = (pool_id, version, new_names=None, category=None, description=None,
-        posts=None, fields=None))]
-    #[allow(clippy::too_many_arguments)]
-    /// Updates an existing pool using specified parameters (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_pool` for parameters and return type
-    pub async fn update_pool(
+    pub(crate) async fn create_pools(
+        &self,
+        names: Vec<Py<PyAny>>,
+        category: Option<String>,
+        description: Option<String>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<Vec<PoolResource>> {
+        let cupools = Python::with_gil(|py| {
+            names
+                .iter()
+                .map(|pool_names| -> PyResult<CreateUpdatePool> {
+                    let mut cupool = CreateUpdatePoolBuilder::default();
+                    if let Ok(name) = pool_names.extract::<String>(py) {
+                        cupool.names(vec![name]);
+                    } else {
+                        cupool.names(pool_names.extract::<Vec<String>>(py)?);
+                    }
+                    if let Some(cat) = &category {
+                        cupool.category(cat.clone());
+                    }
+                    if let Some(desc) = &description {
+                        cupool.description(desc.clone());
+                    }
+                    Ok(cupool.build()?)
+                })
+                .collect::<PyResult<Vec<_>>>()
+        })?;
+        let results = self
+            .client
+            .with_optional_fields(fields)
+            .create_pools(&cupools)
+            .await;
+        self.invalidate_pool_categories();
+
+        let mut created = Vec::new();
+        let mut failures = Vec::new();
+        for (cupool, result) in cupools.iter().zip(results) {
+            match result {
+                Ok(pool) => created.push(pool),
+                Err(e) => failures.push(format!(
+                    "{}: {}",
+                    cupool.names.as_deref().unwrap_or_default().join(", "),
+                    e
+                )),
+            }
+        }
+        if failures.is_empty() {
+            return Ok(created);
+        }
+        let details = format!(
+            "{} of {} pools could not be created ({}). {} pools were created",
+            failures.len(),
+            cupools.len(),
+            failures.join("; "),
+            created.len()
+        );
+        Err(SzuruClientError::new_err((
+            "CreatePoolsError".to_string(),
+            details,
+            created,
+        )))
+    }
+
+    pub(crate) async fn update_pool(
         &self,
         pool_id: u32,
         version: u32,
@@ -964,18 +1899,17 @@ impl PythonAsyncClient {
             cupool.posts(posts);
         }
         let cupool = cupool.build()?;
-        self.client
+        let result = self
+            .client
             .with_optional_fields(fields)
             .update_pool(pool_id, &cupool)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_pool_categories();
+        result
     }
 
-    #[pyo3(signature = (pool_id, fields=None))]
-    /// Retrieves information about an existing pool (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_pool` for parameters and return type
-    pub async fn get_pool(
+    pub(crate) async fn get_pool(
         &self,
         pool_id: u32,
         fields: Option<Vec<String>>,
@@ -987,22 +1921,18 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    /// Deletes existing pool (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_pool` for parameters and return type
-    pub async fn delete_pool(&self, pool_id: u32, version: u32) -> PyResult<()> {
-        self.client
+    pub(crate) async fn delete_pool(&self, pool_id: u32, version: u32) -> PyResult<()> {
+        let result = self
+            .client
             .request()
             .delete_pool(pool_id, version)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_pool_categories();
+        result
     }
 
-    #[pyo3(signature = (remove_pool, remove_pool_version, merge_to_pool, merge_to_version, fields=None))]
-    /// Removes source pool and merges all of its posts with the target pool. (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.merge_pools` for parameters and return type
-    pub async fn merge_pools(
+    pub(crate) async fn merge_pools(
         &self,
         remove_pool: u32,
         remove_pool_version: u32,
@@ -1016,18 +1946,17 @@ impl PythonAsyncClient {
             .merge_to_version(merge_to_version)
             .merge_to_pool(merge_to_pool)
             .build()?;
-        self.client
+        let result = self
+            .client
             .with_optional_fields(fields)
             .merge_pools(&mpool)
             .await
-            .map_err(Into::into)
+            .map_err(Into::into);
+        self.invalidate_pool_categories();
+        result
     }
 
-    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
-    /// List the comments currently available on the site (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_comments` for parameters and return type
-    pub async fn list_comments(
+    pub(crate) async fn list_comments(
         &self,
         query: Option<Vec<QueryToken>>,
         fields: Option<Vec<String>>,
@@ -1044,11 +1973,7 @@ impl PythonAsyncClient {
             .map(Into::into)
     }
 
-    #[pyo3(signature = (text, post_id, fields=None))]
-    /// Creates a new comment under a given post (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_comment` for parameters and return type
-    pub async fn create_comment(
+    pub(crate) async fn create_comment(
         &self,
         text: String,
         post_id: u32,
@@ -1066,11 +1991,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (comment_id, version, text, fields=None))]
-    /// Updates an existing comment with new text (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_comment` for parameters and return type
-    pub async fn update_comment(
+    pub(crate) async fn update_comment(
         &self,
         comment_id: u32,
         version: u32,
@@ -1089,11 +2010,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (comment_id, fields=None))]
-    /// Fetches an existing comment (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_comment` for parameters and return type
-    pub async fn get_comment(
+    pub(crate) async fn get_comment(
         &self,
         comment_id: u32,
         fields: Option<Vec<String>>,
@@ -1105,10 +2022,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    /// Deletes an existing comment (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_comment` for parameters and return type
-    pub async fn delete_comment(&self, comment_id: u32, version: u32) -> PyResult<()> {
+    pub(crate) async fn delete_comment(&self, comment_id: u32, version: u32) -> PyResult<()> {
         self.client
             .request()
             .delete_comment(comment_id, version)
@@ -1116,12 +2030,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (comment_id, rating, fields=None))]
-    /// Updates score of authenticated user for given comment. Valid scores are -1, 0 and 1.
-    /// (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.rate_comment` for parameters and return type
-    pub async fn rate_comment(
+    pub(crate) async fn rate_comment(
         &self,
         comment_id: u32,
         rating: i8,
@@ -1134,11 +2043,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
-    /// List the users currently registered on the site (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_users` for parameters and return type
-    pub async fn list_users(
+    pub(crate) async fn list_users(
         &self,
         query: Option<Vec<QueryToken>>,
         fields: Option<Vec<String>>,
@@ -1155,11 +2060,7 @@ impl PythonAsyncClient {
             .map(Into::into)
     }
 
-    #[pyo3(signature = (name, password, rank=None, avatar_path=None, fields=None))]
-    /// Creates a new user using specified parameters (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_user` for parameters and return type
-    pub async fn create_user(
+    pub(crate) async fn create_user(
         &self,
         name: String,
         password: String,
@@ -1192,12 +2093,7 @@ impl PythonAsyncClient {
         }
     }
 
-    #[pyo3(signature = (name, version, new_name=None, password=None, rank=None, avatar_path=None, fields=None))]
-    #[allow(clippy::too_many_arguments)]
-    /// Updates an existing user using specified parameters (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update` for parameters and return type
-    pub async fn update_user(
+    pub(crate) async fn update_user(
         &self,
         name: String,
         version: u32,
@@ -1237,11 +2133,7 @@ impl PythonAsyncClient {
         }
     }
 
-    #[pyo3(signature = (user_name, fields=None))]
-    /// Retrieves information about an existing user (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.get_user` for parameters and return type
-    pub async fn get_user(
+    pub(crate) async fn get_user(
         &self,
         user_name: String,
         fields: Option<Vec<String>>,
@@ -1253,10 +2145,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    /// Deletes an existing user (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_user` for parameters and return type
-    pub async fn delete_user(&self, user_name: String, version: u32) -> PyResult<()> {
+    pub(crate) async fn delete_user(&self, user_name: String, version: u32) -> PyResult<()> {
         self.client
             .request()
             .delete_user(user_name, version)
@@ -1264,11 +2153,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (user_name, fields=None))]
-    /// Fetches a list of the given user's auth tokens (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_user_tokens` for parameters and return type
-    pub async fn list_user_tokens(
+    pub(crate) async fn list_user_tokens(
         &self,
         user_name: String,
         fields: Option<Vec<String>>,
@@ -1281,11 +2166,7 @@ impl PythonAsyncClient {
             .map(|ur| ur.results)
     }
 
-    #[pyo3(signature = (user_name, note=None, enabled=None, expiration_time=None, fields=None))]
-    /// Creates an auth token for the given user (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.create_user_token` for parameters and return type
-    pub async fn create_user_token(
+    pub(crate) async fn create_user_token(
         &self,
         user_name: String,
         note: Option<String>,
@@ -1311,12 +2192,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    #[pyo3(signature = (user_name, token, version, enabled=None, note=None, expiration_time=None, fields=None))]
-    #[allow(clippy::too_many_arguments)]
-    /// Update a user's existing auth token (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.update_user_token` for parameters and return type
-    pub async fn update_user_token(
+    pub(crate) async fn update_user_token(
         &self,
         user_name: String,
         token: String,
@@ -1345,10 +2221,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    /// Deletes an existing user auth token (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.delete_user_token` for parameters and return type
-    pub async fn delete_user_token(
+    pub(crate) async fn delete_user_token(
         &self,
         user_name: String,
         token: String,
@@ -1361,10 +2234,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    /// Start a password reset request (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.password_reset_request` for parameters and return type
-    pub async fn password_reset_request(&self, email_or_name: String) -> PyResult<()> {
+    pub(crate) async fn password_reset_request(&self, email_or_name: String) -> PyResult<()> {
         self.client
             .request()
             .password_reset_request(email_or_name)
@@ -1372,10 +2242,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    /// Confirm a password reset request (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.password_reset_confirm` for parameters and return type
-    pub async fn password_reset_confirm(
+    pub(crate) async fn password_reset_confirm(
         &self,
         email_or_name: String,
         reset_token: String,
@@ -1388,11 +2255,7 @@ impl PythonAsyncClient {
             .map(|tp| tp.password)
     }
 
-    #[pyo3(signature = (query=None, fields=None, limit=None, offset=None))]
-    /// List the snapshots currently available on the site (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.list_snapshots` for parameters and return type
-    pub async fn list_snapshots(
+    pub(crate) async fn list_snapshots(
         &self,
         query: Option<Vec<QueryToken>>,
         fields: Option<Vec<String>>,
@@ -1409,16 +2272,7 @@ impl PythonAsyncClient {
             .map(Into::into)
     }
 
-    /// Retrieves simple statistics. ``featured_post`` is ``None`` if there is no featured post yet.
-    /// ``server_time`` is pretty much the same as the Date HTTP
-    /// field, only formatted in a manner consistent with other dates. Values in config key are
-    /// taken directly from the server config, with the exception of privilege array keys being
-    /// converted to lower camel case to match the API convention.
-    ///
-    /// (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.global_info` for parameters and return type
-    pub async fn global_info(&self) -> PyResult<GlobalInfo> {
+    pub(crate) async fn global_info(&self) -> PyResult<GlobalInfo> {
         self.client
             .request()
             .get_global_info()
@@ -1426,11 +2280,7 @@ impl PythonAsyncClient {
             .map_err(Into::into)
     }
 
-    /// Puts a file from a given file path in temporary storage and assigns it a token that can be
-    /// used in other requests. (async version)
-    ///
-    /// :see: :func:`~szurubooru_client.SzurubooruSyncClient.upload_temporary_file` for parameters and return type
-    pub async fn upload_temporary_file(&self, file_path: PathBuf) -> PyResult<String> {
+    pub(crate) async fn upload_temporary_file(&self, file_path: PathBuf) -> PyResult<String> {
         self.client
             .request()
             .upload_temporary_file_from_path(file_path)
@@ -1438,4 +2288,24 @@ impl PythonAsyncClient {
             .map_err(Into::into)
             .map(|t| t.token)
     }
+
+    /// Drops any cached tag categories. Called after anything that can change a tag category,
+    /// including its ``usages`` count
+    fn invalidate_tag_categories(&self) {
+        if let Some(cache) = &self.category_cache {
+            let mut cache = cache.lock().unwrap();
+            cache.tag_categories.clear();
+            cache.tag_generation += 1;
+        }
+    }
+
+    /// Drops any cached pool categories. Called after anything that can change a pool category,
+    /// including its ``usages`` count
+    fn invalidate_pool_categories(&self) {
+        if let Some(cache) = &self.category_cache {
+            let mut cache = cache.lock().unwrap();
+            cache.pool_categories.clear();
+            cache.pool_generation += 1;
+        }
+    }
 }
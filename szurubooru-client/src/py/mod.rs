@@ -1,6 +1,9 @@
 use crate::models::PagedSearchResult;
 use pyo3::prelude::*;
 use pyo3::types::PyList;
+use std::future::Future;
+use std::sync::OnceLock;
+use tokio::runtime::{Builder, Runtime};
 
 // rustfmt likes to break the Python docstrings
 #[rustfmt::skip]
@@ -8,6 +11,39 @@ pub mod asynchronous;
 #[rustfmt::skip]
 pub mod synchronous;
 
+/// Runtime that drives the IO and timers of the asynchronous client.
+///
+/// The client's coroutines are polled by whatever Python event loop awaits them, but reqwest
+/// needs a tokio reactor for its sockets and timers. This runtime's worker threads run that
+/// reactor in the background and execute the connection tasks hyper spawns.
+///
+/// It's only started by the asynchronous client. The synchronous client blocks on its calls with a
+/// runtime owned by each instance, so it never spawns these threads and keeps working in forked
+/// children.
+fn runtime() -> &'static Runtime {
+    static RUNTIME: OnceLock<Runtime> = OnceLock::new();
+    RUNTIME.get_or_init(|| {
+        Builder::new_multi_thread()
+            .enable_all()
+            .thread_name("szurubooru-client")
+            .build()
+            .expect("Unable to start the tokio runtime")
+    })
+}
+
+/// Wraps a future so that every poll happens inside the context of [runtime], letting it create
+/// tokio resources even though it's being polled by a Python event loop
+pub(crate) fn in_runtime<T>(
+    fut: impl Future<Output = PyResult<T>> + Send,
+) -> impl Future<Output = PyResult<T>> + Send {
+    let handle = runtime().handle().clone();
+    let mut fut = Box::pin(fut);
+    std::future::poll_fn(move |cx| {
+        let _guard = handle.enter();
+        fut.as_mut().poll(cx)
+    })
+}
+
 #[derive(Debug)]
 #[pyclass(name = "PagedResult", get_all, module = "szurubooru_client")]
 /// A paged result generated by most of the ``list`` methods of the Szurubooru clients
@@ -1,5 +1,5 @@
 use crate::models::*;
-use crate::py::asynchronous::PythonAsyncClient;
+use crate::py::asynchronous::ClientCore;
 use crate::py::PyPagedSearchResult;
 use crate::tokens::QueryToken;
 use chrono::{DateTime, Utc};
@@ -17,17 +17,19 @@ use tokio::runtime::{Builder, Runtime};
 /// :param str password: The password to use for ``Basic`` authentication. Token authentication should be preferred
 /// :param str token: The token to use for ``Bearer`` authentication.
 /// :param bool allow_insecure: Disable cert validation. Disables SSL authentication
+/// :param bool cache_categories: Cache the results of ``list_tag_categories`` and ``list_pool_categories`` until this client changes a tag, post, pool or category. Changes made by other clients won't be seen while the results are cached
 ///
 /// :rtype: SzurubooruSyncClient
 pub struct PythonSyncClient {
-    client: PythonAsyncClient,
+    client: ClientCore,
     runtime: Runtime,
 }
 
 #[pymethods]
 impl PythonSyncClient {
     #[new]
-    #[pyo3(signature = (host, username=None, token=None, password=None, allow_insecure=None))]
+    #[pyo3(signature = (host, username=None, token=None, password=None, allow_insecure=None,
+        cache_categories=None))]
     /// This method is for creating new instances of the SzurubooruSyncClient
     pub fn new(
         host: String,
@@ -35,9 +37,17 @@ impl PythonSyncClient {
         token: Option<String>,
         password: Option<String>,
         allow_insecure: Option<bool>,
+        cache_categories: Option<bool>,
     ) -> PyResult<Self> {
         let runtime = Builder::new_current_thread().enable_all().build()?;
-        let client = PythonAsyncClient::new(host, username, token, password, allow_insecure)?;
+        let client = ClientCore::new(
+            host,
+            username,
+            token,
+            password,
+            allow_insecure,
+            cache_categories,
+        )?;
         Ok(Self { client, runtime })
     }
 
@@ -526,7 +536,7 @@ impl PythonSyncClient {
     /// :param int post_id: The ID of the post to fetch
     ///
     /// :return: A byte array of the given post's content
-    /// :rtype: list[byte]
+    /// :rtype: bytes
     pub fn get_image_bytes(&self, post_id: u32) -> PyResult<Vec<u8>> {
         self.runtime.block_on(self.client.get_image_bytes(post_id))
     }
@@ -536,9 +546,17 @@ impl PythonSyncClient {
     ///
     /// :param int post_id: The ID of the post to fetch
     /// :param Path|str file_path: The path to download the image to
-    pub fn download_image_to_path(&self, post_id: u32, file_path: PathBuf) -> PyResult<()> {
-        self.runtime
-            .block_on(self.client.download_image_to_path(post_id, file_path))
+    pub fn download_image_to_path(
+        &self,
+        py: Python<'_>,
+        post_id: u32,
+        file_path: PathBuf,
+    ) -> PyResult<()> {
+        // The body is streamed straight from the socket to the file, so nothing needs the GIL
+        py.allow_threads(|| {
+            self.runtime
+                .block_on(self.client.download_image_to_path(post_id, file_path))
+        })
     }
 
     #[pyo3(signature = (post_id))]
@@ -546,8 +564,8 @@ impl PythonSyncClient {
     ///
     /// :param int post_id: The ID of the post to fetch
     ///
-    /// :return: A byte array of the given post's content
-    /// :rtype: list[byte]
+    /// :return: The given post's thumbnail
+    /// :rtype: bytes
     pub fn get_thumbnail_bytes(&self, post_id: u32) -> PyResult<Vec<u8>> {
         self.runtime
             .block_on(self.client.get_thumbnail_bytes(post_id))
@@ -558,9 +576,17 @@ impl PythonSyncClient {
     ///
     /// :param int post_id: The ID of the post to fetch
     /// :param Path|str file_path: The path to download the thumbnail to
-    pub fn download_thumbnail_to_path(&self, post_id: u32, file_path: PathBuf) -> PyResult<()> {
-        self.runtime
-            .block_on(self.client.download_thumbnail_to_path(post_id, file_path))
+    pub fn download_thumbnail_to_path(
+        &self,
+        py: Python<'_>,
+        post_id: u32,
+        file_path: PathBuf,
+    ) -> PyResult<()> {
+        // The body is streamed straight from the socket to the file, so nothing needs the GIL
+        py.allow_threads(|| {
+            self.runtime
+                .block_on(self.client.download_thumbnail_to_path(post_id, file_path))
+        })
     }
 
     #[pyo3(signature = (image_path))]
@@ -959,6 +985,41 @@ impl PythonSyncClient {
         )
     }
 
+    #[pyo3(signature = (names, category=None, description=None, fields=None))]
+    /// Creates several pools in one call. Szurubooru has no bulk creation endpoint, so the
+    /// pools are created with concurrent requests rather than one request after the other.
+    /// Each pool gets the same ``category`` and ``description``.
+    ///
+    /// .. warning::
+    ///     This is not atomic. Every request is run to completion, and if any of them fail a
+    ///     :class:`~szurubooru_client.SzuruClientError` is raised whose details name each pool
+    ///     that failed. The pools that *were* created are kept on the server and are passed as
+    ///     the third argument of the exception, so ``e.args[2]`` can be used to reconcile or
+    ///     clean them up.
+    ///
+    /// .. note::
+    ///     This method supports :doc:`Field selection </fields>`
+    ///
+    /// :param list[list[str]|str] names: The name or names for each of the new pools
+    /// :param Optional[str] category: The pool category for these pools
+    /// :param Optional[str] description: The description for these pools
+    /// :param Optional[list[str]] fields: A list of fields to select for the returned objects
+    ///
+    /// :return: The pool resources, in the same order as ``names``
+    /// :rtype: list[:class:`~szurubooru_client.models.PoolResource`]
+    pub fn create_pools(
+        &self,
+        names: Vec<Py<PyAny>>,
+        category: Option<String>,
+        description: Option<String>,
+        fields: Option<Vec<String>>,
+    ) -> PyResult<Vec<PoolResource>> {
+        self.runtime.block_on(
+            self.client
+                .create_pools(names, category, description, fields),
+        )
+    }
+
     #[pyo3(signature = (pool_id, version, new_names=None, category=None, description=None,
         posts=None, fields=None))]
     #[allow(clippy::too_many_arguments)]
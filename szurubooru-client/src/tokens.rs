@@ -27,7 +27,10 @@ pub trait ToQueryString {
 
 /// A query token using for searching posts, tags and pools
 #[derive(Debug, Clone)]
-#[cfg_attr(all(feature = "python"), pyclass(module = "szurubooru_client.tokens"))]
+#[cfg_attr(
+    all(feature = "python"),
+    pyclass(frozen, module = "szurubooru_client.tokens")
+)]
 pub struct QueryToken {
     /// The key for this token. For `foo:bar` this would be `foo`
     pub key: String,
@@ -1,34 +1,53 @@
 from .szurubooru_client import _models
 
-AroundPostResult = _models.AroundPostResult
-CommentResource = _models.CommentResource
-GlobalInfo = _models.GlobalInfo
-ImageSearchResult = _models.ImageSearchResult
-ImageSearchSimilarPost = _models.ImageSearchSimilarPost
-MicroPoolResource = _models.MicroPoolResource
-MicroPostResource = _models.MicroPostResource
-MicroTagResource = _models.MicroTagResource
-MicroUserResource = _models.MicroUserResource
-NoteResource = _models.NoteResource
-PoolCategoryResource = _models.PoolCategoryResource
-PoolResource = _models.PoolResource
-PostResource = _models.PostResource
-PostSafety = _models.PostSafety
-PostType = _models.PostType
-SnapshotCreationDeletionData = _models.SnapshotCreationDeletionData
-SnapshotData = _models.SnapshotData
-SnapshotModificationData = _models.SnapshotModificationData
-SnapshotOperationType = _models.SnapshotOperationType
-SnapshotResource = _models.SnapshotResource
-SnapshotResourceType = _models.SnapshotResourceType
-TagCategoryResource = _models.TagCategoryResource
-TagResource = _models.TagResource
-TagSibling = _models.TagSibling
-UserAuthTokenResource = _models.UserAuthTokenResource
-UserAvatarStyle = _models.UserAvatarStyle
-UserRank = _models.UserRank
-UserResource = _models.UserResource
+__all__ = [
+    "AroundPostResult",
+    "CommentResource",
+    "GlobalInfo",
+    "ImageSearchResult",
+    "ImageSearchSimilarPost",
+    "MicroPoolResource",
+    "MicroPostResource",
+    "MicroTagResource",
+    "MicroUserResource",
+    "NoteResource",
+    "PoolCategoryResource",
+    "PoolResource",
+    "PostResource",
+    "PostSafety",
+    "PostType",
+    "SnapshotCreationDeletionData",
+    "SnapshotData",
+    "SnapshotModificationData",
+    "SnapshotOperationType",
+    "SnapshotResource",
+    "SnapshotResourceType",
+    "TagCategoryResource",
+    "TagResource",
+    "TagSibling",
+    "UserAuthTokenResource",
+    "UserAvatarStyle",
+    "UserRank",
+    "UserResource",
+]
+
+
+_EXPORTS = frozenset(__all__)
+
+
+def __getattr__(name):
+    # Resolve the re-exported names from the extension module on first use instead of copying
+    # every one of them at import time. The result is stored in the module so later lookups
+    # don't come back through here
+    if name in _EXPORTS:
+        value = getattr(_models, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _EXPORTS)
+
 
 __doc__ = _models.__doc__
-#if hasattr(_models, "__all__"):
-#    __all__ = getattr(_models, "__all__")
@@ -0,0 +1,441 @@
+from szurubooru_client import *
+from szurubooru_client.tokens import *
+from szurubooru_client.models import *
+import asyncio, sys
+from loguru import logger
+import hashlib
+import tempfile, pathlib
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "python-common"))
+from shared import (CAT_TOKEN, MAINE_TOKEN, ID_FIELDS, NAME_FIELDS, TAG_FIELDS,
+                    TAG_CATEGORY_FIELDS, TMPFS_DIR, CONNECT_ATTEMPTS, retry_delay, file_sha1,
+                    source_sha1)
+
+async def connect():
+    logger.info("Connecting to Szurubooru instance")
+    anon_client = SzurubooruAsyncClient("http://localhost:9803")
+    error = None
+    for i in range(CONNECT_ATTEMPTS):
+        try:
+            await anon_client.global_info()
+        except Exception as e:
+            error=e
+            delay = retry_delay(i)
+            logger.info("Connection attempt {} failed, retrying in {:.2f}s", i + 1, delay)
+            await asyncio.sleep(delay)
+        else:
+            logger.info("Connection successful!")
+            break
+    else:
+        logger.error("Could not connect to Szurubooru instance, error is {}", error)
+        sys.exit(1)
+    return anon_client
+
+async def create_auth_client(client):
+    await client.create_user("integration_user", "integration_password", rank=UserRank.Administrator)
+    auth_client = SzurubooruAsyncClient("http://localhost:9803", username="integration_user",
+                                        password="integration_password", allow_insecure=True)
+    return auth_client
+
+async def test_tag_categories(client):
+    logger.info("Testing tag categories")
+    logger.info("Listing tag categories")
+    tag_cats = await client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
+    assert len(tag_cats) == 1
+
+    logger.info("Creating tag category")
+    result_tag_cat = await client.create_tag_category("my_tag_cat", color="purple", order=1)
+    assert result_tag_cat.name == "my_tag_cat"
+
+    tag_cats = await client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
+    assert len(tag_cats) != 1
+    assert tag_cats[1].name == "my_tag_cat"
+
+    logger.info("Updating tag category")
+    update_tag_cat = await client.update_tag_category("my_tag_cat", result_tag_cat.version, color="red")
+    assert update_tag_cat.color != result_tag_cat.color
+
+    logger.info("Getting tag category")
+    get_tag_cat = await client.get_tag_category("my_tag_cat")
+    assert get_tag_cat.color == update_tag_cat.color
+
+    logger.info("Deleting tag category")
+    await client.delete_tag_category("my_tag_cat", get_tag_cat.version)
+    tag_cats = await client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
+    assert len(tag_cats) == 1
+
+async def test_tag(client):
+    logger.info("Testing tags")
+    logger.info("Listing tags")
+
+    tags = await client.list_tags(fields=TAG_FIELDS)
+    assert len(tags.results) == 0
+
+    logger.info("Creating tag")
+    foo_tag = await client.create_tag("foo", category="default", description="The foo tag")
+    assert foo_tag.names == ["foo"]
+    tags = await client.list_tags(fields=TAG_FIELDS)
+    assert len(tags.results) == 1
+
+    logger.info("Testing field selection")
+    tags = await client.list_tags(fields=["version", "names", "category"])
+    assert len(tags.results) == 1
+    assert tags.results[0].description is None
+
+    logger.info("Updating tag")
+    foo_tag = await client.update_tag(foo_tag.names[0], version=foo_tag.version, description="The foo2 tag")
+    assert foo_tag.description == "The foo2 tag"
+
+    logger.info("Getting tag")
+    foo_tag2 = await client.get_tag("foo")
+    assert foo_tag.description == foo_tag2.description
+
+    logger.info("Creating a second tag")
+    bar_tag = await client.create_tag("bar", category="default", description="The bar tag")
+    assert bar_tag.names == ["bar"]
+
+    logger.info("Merging tags")
+    foo_tag2 = await client.merge_tags(bar_tag.names[0], bar_tag.version,
+                                       foo_tag2.names[0], foo_tag2.version)
+    tags = await client.list_tags(fields=TAG_FIELDS)
+    assert len(tags.results) == 1
+
+    logger.info("Deleting tag")
+    await client.delete_tag(foo_tag2.names[0], foo_tag2.version)
+
+async def test_creating_posts(client):
+    logger.info("Testing posts")
+
+    logger.info("Listing posts")
+    posts = await client.list_posts(fields=ID_FIELDS)
+    assert len(posts.results) == 0
+
+    logger.info("Creating post from URL")
+    wiki_post = await client.create_post(url="https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Maine_Coon_cat_by_Tomitheos.JPG/225px-Maine_Coon_cat_by_Tomitheos.JPG",
+                                         safety=PostSafety.Safe)
+    posts = await client.list_posts(fields=ID_FIELDS)
+    assert len(posts.results) == 1
+
+    logger.info("Updating post")
+    wiki_post = await client.update_post(wiki_post.id, wiki_post.version, source="Wikipedia")
+    assert wiki_post.source == "Wikipedia"
+
+    logger.info("Deleting post")
+    await client.delete_post(wiki_post.id, wiki_post.version)
+    posts = await client.list_posts(fields=ID_FIELDS)
+    assert len(posts.results) == 0
+
+    async def create_folly4():
+        token = await client.upload_temporary_file("../folly4.jpg")
+        return await client.create_post(upload_token=token, tags=["maine_coon", "cat", "folly4"],
+                                        safety=PostSafety.Safe)
+
+    logger.info("Testing upload by file path, with thumbnail and by temporary upload")
+    # The server creates missing tags inside each post's transaction, so concurrent uploads
+    # sharing a new tag would race on its name. The first upload creates the shared tags
+    folly1 = await client.create_post(file_path="../folly1.jpg",
+                                      tags=["maine_coon", "cat", "folly1"],
+                                      safety=PostSafety.Safe)
+    folly2, folly3, folly4 = await asyncio.gather(
+        client.create_post(file_path="../folly2.jpg",
+                           tags=["maine_coon", "cat", "folly2"],
+                           safety=PostSafety.Safe),
+        client.create_post(file_path="../folly3.jpg",
+                           thumbnail_path="../folly3_thumb.jpg",
+                           tags=["maine_coon", "cat", "folly3"],
+                           safety=PostSafety.Safe),
+        create_folly4())
+    posts = await client.list_posts(fields=ID_FIELDS)
+    assert len(posts.results) == 4
+
+    logger.info("Searching for a post with image")
+    folly3_search = await client.post_for_image("../folly3.jpg")
+    assert folly3_search is not None
+    assert folly3_search.id == folly3.id
+
+    logger.info("Reverse image searching")
+    reverse_search = await client.reverse_image_search("../folly3.jpg")
+    assert reverse_search.exact_post.id == folly3.id
+
+    logger.info("Querying by anonymous tag")
+    cat_posts = await client.list_posts(query=[CAT_TOKEN], fields=ID_FIELDS)
+    assert len(cat_posts.results) == 4
+
+    logger.info("Querying by named tag")
+    cat_posts = await client.list_posts(query=[MAINE_TOKEN], fields=ID_FIELDS)
+    assert len(cat_posts.results) == 4
+
+    logger.info("Querying using typesafe types")
+    cat_posts = await client.list_posts(query=[named_token(PostNamedToken.Safety, PostSafety.Safe)],
+                                        fields=ID_FIELDS)
+    assert len(cat_posts.results) == 4
+
+    logger.info("Testing pagination")
+    cat_posts = await client.list_posts(fields=ID_FIELDS, limit=1)
+    assert cat_posts.total == 4
+    assert len(cat_posts.results) == 1
+
+    cat_posts2 = await client.list_posts(fields=ID_FIELDS, limit=1, offset=1)
+    assert cat_posts.results != cat_posts2.results
+
+    logger.info("Testing tag siblings")
+    tag_occurrences = await client.get_tag_siblings("maine_coon")
+    cat_occurrences = [x for x in tag_occurrences if "cat" in x.tag.names]
+    assert len(cat_occurrences) == 1
+
+    logger.info("Rating post")
+    await client.rate_post(folly3.id, 1)
+
+    logger.info("Testing rating error validation")
+    try:
+        await client.rate_post(folly3.id, -2)
+    except ValueError:
+        assert True
+    else:
+        assert False
+
+    logger.info("Favoriting post")
+    await client.favorite_post(folly3.id)
+
+    logger.info("Unfavoriting post")
+    await client.unfavorite_post(folly3.id)
+
+    logger.info("Featuring post")
+    await client.set_featured_post(folly3.id)
+
+    logger.info("Getting featured post")
+    featured_post = await client.get_featured_post()
+    assert folly3.id == featured_post.id
+
+    logger.info("Merging posts")
+    merged_post = await client.merge_post(folly4.id, folly4.version, folly3.id, folly3.version)
+    assert merged_post.id == folly3.id
+
+async def test_pool_categories(client):
+    logger.info("Testing pool categories")
+
+    logger.info("Listing pool categories")
+    pool_cats = await client.list_pool_categories(fields=NAME_FIELDS)
+    assert len(pool_cats) != 0
+
+    logger.info("Creating pool category")
+    pool_cat = await client.create_pool_category("cat_pool_category", color="purple")
+    assert pool_cat.color == "purple"
+    pool_dog = await client.create_pool_category("dog_category", color="orange")
+
+    logger.info("Updating pool category")
+    pool_cat = await client.update_pool_category(pool_cat.name, pool_cat.version, color="white")
+    assert pool_cat.color == "white"
+
+    logger.info("Getting pool category")
+    pool_dog = await client.get_pool_category(pool_dog.name)
+    assert pool_dog.color == "orange"
+
+    logger.info("Deleting pool category")
+    pool_dog = await client.delete_pool_category(pool_dog.name, pool_dog.version)
+
+    logger.info("Setting default pool category")
+    await client.set_default_pool_category(pool_cat.name)
+
+async def test_pools(client):
+    logger.info("Testing post pools")
+    logger.info("Listing post pools")
+    pools = await client.list_pools(fields=ID_FIELDS)
+    assert len(pools.results) == 0
+
+    logger.info("Creating pools")
+    cat_pool, catz_pool, dogs_pool = await client.create_pools(["cats_pool", "catz_pool", "dogs_pool"],
+                                                               category="cat_pool_category")
+
+    logger.info("Creating pools when one of the names is taken")
+    try:
+        await client.create_pools(["cats_pool", "kittens_pool"], category="cat_pool_category")
+    except SzuruClientError as e:
+        kind, details, created = e.args
+        assert kind == "CreatePoolsError"
+        assert "cats_pool" in details
+        assert [p.names for p in created] == [["kittens_pool"]]
+    else:
+        assert False, "Creating a pool with a duplicate name should fail"
+    await client.delete_pool(created[0].id, created[0].version)
+
+    logger.info("Deleting pool")
+    await client.delete_pool(dogs_pool.id, dogs_pool.version)
+
+    logger.info("Updating pool")
+    f4_results = await client.list_posts([CAT_TOKEN], fields=ID_FIELDS)
+    post_ids = [p.id for p in f4_results.results]
+    cat_pool = await client.update_pool(cat_pool.id, cat_pool.version,
+                                        posts=post_ids, description="All cat pictures")
+    assert len(cat_pool.posts) != 0
+    assert cat_pool.description == "All cat pictures"
+
+    logger.info("Merging pools")
+    merged_pool = await client.merge_pools(catz_pool.id, catz_pool.version, cat_pool.id, cat_pool.version)
+    assert merged_pool.id == cat_pool.id
+
+    logger.info("Getting pool")
+    merged_pool = await client.get_pool(merged_pool.id)
+    assert merged_pool.description == "All cat pictures"
+    assert merged_pool.names == ["cats_pool"]
+
+async def test_comments(client):
+    logger.info("Testing post comments")
+
+    logger.info("Listing post comments")
+    comment_list = await client.list_comments(fields=ID_FIELDS)
+    assert len(comment_list.results) == 0
+
+    cat_results = await client.list_posts([CAT_TOKEN], fields=ID_FIELDS)
+    post_id = cat_results.results[0].id
+
+    logger.info("Creating comment")
+    comment = await client.create_comment("Excellent cat!", post_id)
+
+    logger.info("Updating comment")
+    comment = await client.update_comment(comment.id, comment.version, text="Beautiful cat!")
+    assert comment.text == "Beautiful cat!"
+
+    logger.info("Getting comment")
+    comment = await client.get_comment(comment.id)
+    assert comment.text == "Beautiful cat!"
+
+    logger.info("Getting all comments for post")
+    comment_list = await client.list_comments([named_token(CommentNamedToken.Post, post_id)], fields=ID_FIELDS)
+    assert len(comment_list.results) != 0
+
+    logger.info("Testing rating comments")
+    comment = await client.rate_comment(comment.id, -1)
+    assert comment.own_score == -1
+
+    try:
+        await client.rate_comment(comment.id, -2)
+    except SzuruClientError:
+        assert True
+    else:
+        assert False
+
+    logger.info("Deleting comment")
+    await client.delete_comment(comment.id, comment.version)
+
+async def test_users(client):
+    logger.info("Testing users")
+
+    logger.info("Listing users")
+    user_list = await client.list_users(fields=NAME_FIELDS)
+
+    logger.info("Creating user with avatar")
+    user = await client.create_user("iu2", "ipass2", rank=UserRank.Regular, avatar_path="../avatar.jpg")
+    assert user.avatar_style == UserAvatarStyle.Manual
+
+    logger.info("Updating user")
+    user = await client.update_user(user.name, user.version, rank=UserRank.Restricted)
+
+    logger.info("Getting user")
+    user = await client.get_user(user.name)
+
+    logger.info("Deleting user")
+    await client.delete_user(user.name, user.version)
+
+    logger.info("Listing user tokens")
+    tokens = await client.list_user_tokens("integration_user")
+    assert len(tokens) == 0
+
+    logger.info("Creating user token")
+    token = await client.create_user_token("integration_user", "My token")
+
+    logger.info("Updating user token")
+    token2 = await client.update_user_token("integration_user", token.token, token.version, enabled=False)
+    assert token2.enabled == False
+
+    logger.info("Deleting user token")
+    await client.delete_user_token("integration_user", token2.token, token2.version)
+
+async def test_category_cache(client):
+    logger.info("Testing category caching")
+    cached_client = SzurubooruAsyncClient("http://localhost:9803", username="integration_user",
+                                          password="integration_password", allow_insecure=True,
+                                          cache_categories=True)
+
+    logger.info("Checking tag categories are served from the cache")
+    tag_cats = await cached_client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
+    other_tag_cat = await client.create_tag_category("uncached_tag_cat", color="green")
+    tag_cats2 = await cached_client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
+    assert len(tag_cats2) == len(tag_cats)
+
+    logger.info("Checking the tag category cache is invalidated by writes")
+    tag_cat = await cached_client.create_tag_category("cached_tag_cat", color="blue")
+    tag_cats3 = await cached_client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
+    assert len(tag_cats3) == len(tag_cats) + 2
+    await cached_client.delete_tag_category(tag_cat.name, tag_cat.version)
+    await cached_client.delete_tag_category(other_tag_cat.name, other_tag_cat.version)
+    tag_cats4 = await cached_client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
+    assert len(tag_cats4) == len(tag_cats)
+
+    logger.info("Checking pool categories are served from the cache")
+    pool_cats = await cached_client.list_pool_categories(fields=NAME_FIELDS)
+    other_pool_cat = await client.create_pool_category("uncached_pool_cat", color="green")
+    pool_cats2 = await cached_client.list_pool_categories(fields=NAME_FIELDS)
+    assert len(pool_cats2) == len(pool_cats)
+
+    logger.info("Checking the pool category cache is invalidated by writes")
+    pool_cat = await cached_client.create_pool_category("cached_pool_cat", color="blue")
+    pool_cats3 = await cached_client.list_pool_categories(fields=NAME_FIELDS)
+    assert len(pool_cats3) == len(pool_cats) + 2
+    await cached_client.delete_pool_category(pool_cat.name, pool_cat.version)
+    await cached_client.delete_pool_category(other_pool_cat.name, other_pool_cat.version)
+    pool_cats4 = await cached_client.list_pool_categories(fields=NAME_FIELDS)
+    assert len(pool_cats4) == len(pool_cats)
+
+async def test_snapshots(client):
+    logger.info("Testing snapshots")
+
+    logger.info("Listing snapshots")
+    snapshot_list = await client.list_snapshots()
+    assert len(snapshot_list.results) != 0
+
+async def test_downloads(client):
+    logger.info("Testing downloads")
+    logger.info("Searching for a post with image")
+    f3_post = await client.post_for_image("../folly3.jpg")
+    assert f3_post is not None
+    f3_sha1 = source_sha1("../folly3.jpg")
+    img_bytes = await client.get_image_bytes(f3_post.id)
+    assert hashlib.sha1(img_bytes).hexdigest() == f3_sha1
+
+    # Keep the download round trip in memory where tmpfs is available
+    with tempfile.TemporaryDirectory(dir=TMPFS_DIR) as tmpdirname:
+        tmpdir = pathlib.Path(tmpdirname)
+        fname = tmpdir / "folly3_dl.jpg"
+        await client.download_image_to_path(f3_post.id, fname)
+        dl_sha1 = file_sha1(fname)
+
+        logger.info("Downloading thumbnail")
+        thumb_fname = tmpdir / "folly3_thumb_dl.jpg"
+        await client.download_thumbnail_to_path(f3_post.id, thumb_fname)
+        thumb_sha1 = file_sha1(thumb_fname)
+
+    assert f3_sha1 == dl_sha1
+    thumb_bytes = await client.get_thumbnail_bytes(f3_post.id)
+    assert len(thumb_bytes) != 0
+    assert hashlib.sha1(thumb_bytes).hexdigest() == thumb_sha1
+
+async def test_tags_and_posts(client):
+    # Posts auto-create tags, so the tag suite has to see an empty tag list first
+    await test_tag(client)
+    await test_creating_posts(client)
+
+async def main():
+    client = await connect()
+    client = await create_auth_client(client)
+    # These suites touch disjoint resources and can share the server
+    await asyncio.gather(test_tag_categories(client), test_pool_categories(client),
+                         test_users(client), test_tags_and_posts(client))
+    # Pools, comments and downloads need the posts and pool categories created above
+    await asyncio.gather(test_pools(client), test_comments(client), test_downloads(client))
+    # Snapshots are only recorded for tags, posts, pools and their categories
+    await test_snapshots(client)
+    await test_category_cache(client)
+
+if __name__ == "__main__":
+    asyncio.run(main())
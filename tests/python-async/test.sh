@@ -0,0 +1,13 @@
+#!/bin/bash
+set -e
+
+# Reuse the sync suite's stack under its own project name and port so both suites can run at once
+export SZURU_PORT=9803
+COMPOSE="docker compose -p szurubooru-async -f ../python-sync/docker-compose.yml"
+
+pip uninstall -y szurubooru_client || true
+pip install -r ../python-sync/requirements.txt
+maturin develop -F python -m ../../szurubooru-client/Cargo.toml
+$COMPOSE down
+$COMPOSE up -d
+python test.py && $COMPOSE down
@@ -0,0 +1,40 @@
+"""Constants and helpers shared by the sync and async integration suites"""
+from szurubooru_client.tokens import PostNamedToken, anonymous_token, named_token
+import hashlib, functools, os
+import random
+
+# Query tokens are immutable, so the ones used by several tests are built once and shared
+CAT_TOKEN = anonymous_token("cat")
+MAINE_TOKEN = named_token(PostNamedToken.Tag, "maine_coon")
+
+# Field selections for list calls that only inspect a few attributes. Tags and tag categories
+# need their version because the models require it
+ID_FIELDS = ["id"]
+NAME_FIELDS = ["name"]
+TAG_FIELDS = ["names", "version"]
+TAG_CATEGORY_FIELDS = ["name", "version"]
+
+TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+CONNECT_ATTEMPTS = 10
+
+def retry_delay(attempt):
+    # Back off exponentially (capped at 5s) so a server that's already up is picked up quickly,
+    # while still waiting ~30s in total for a cold start
+    return min(0.25 * 2**attempt, 5) + random.random() * 0.1
+
+def file_sha1(path):
+    hasher = hashlib.new("sha1")
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def _cached_sha1(path, mtime_ns, size):
+    return file_sha1(path)
+
+def source_sha1(path):
+    # Fixtures are immutable, so repeated calls in the same process only re-hash a modified file
+    st = os.stat(path)
+    return _cached_sha1(path, st.st_mtime_ns, st.st_size)
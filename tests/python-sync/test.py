@@ -6,16 +6,23 @@ from loguru import logger
 import hashlib
 import tempfile, pathlib
 
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "python-common"))
+from shared import (CAT_TOKEN, MAINE_TOKEN, ID_FIELDS, NAME_FIELDS, TAG_FIELDS,
+                    TAG_CATEGORY_FIELDS, TMPFS_DIR, CONNECT_ATTEMPTS, retry_delay, file_sha1,
+                    source_sha1)
+
 def connect():
     logger.info("Connecting to Szurubooru instance")
     anon_client = SzurubooruSyncClient("http://localhost:9802")
     error = None
-    for i in range(5):
+    for i in range(CONNECT_ATTEMPTS):
         try:
             anon_client.global_info()
         except Exception as e:
             error=e
-            time.sleep(5)
+            delay = retry_delay(i)
+            logger.info("Connection attempt {} failed, retrying in {:.2f}s", i + 1, delay)
+            time.sleep(delay)
         else:
             logger.info("Connection successful!")
             break
@@ -33,41 +40,41 @@ def create_auth_client(client):
 def test_tag_categories(client):
     logger.info("Testing tag categories")
     logger.info("Listing tag categories")
-    tag_cats = client.list_tag_categories()
+    tag_cats = client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
     assert len(tag_cats) == 1
 
     logger.info("Creating tag category")
     result_tag_cat = client.create_tag_category("my_tag_cat", color="purple", order=1)
     assert result_tag_cat.name == "my_tag_cat"
 
-    tag_cats = client.list_tag_categories()
+    tag_cats = client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
     assert len(tag_cats) != 1
     assert tag_cats[1].name == "my_tag_cat"
 
+    logger.info("Updating tag category")
+    update_tag_cat = client.update_tag_category("my_tag_cat", result_tag_cat.version, color="red")
+    assert update_tag_cat.color != result_tag_cat.color
+
     logger.info("Getting tag category")
     get_tag_cat = client.get_tag_category("my_tag_cat")
-    assert get_tag_cat.color == result_tag_cat.color
-
-    logger.info("Updating tag category")
-    update_tag_cat = client.update_tag_category("my_tag_cat", get_tag_cat.version, color="red")
-    assert update_tag_cat.color != get_tag_cat.color
+    assert get_tag_cat.color == update_tag_cat.color
 
     logger.info("Deleting tag category")
-    client.delete_tag_category("my_tag_cat", update_tag_cat.version)
-    tag_cats = client.list_tag_categories()
+    client.delete_tag_category("my_tag_cat", get_tag_cat.version)
+    tag_cats = client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
     assert len(tag_cats) == 1
 
 def test_tag(client):
     logger.info("Testing tags")
     logger.info("Listing tags")
 
-    tags = client.list_tags()
+    tags = client.list_tags(fields=TAG_FIELDS)
     assert len(tags.results) == 0
 
     logger.info("Creating tag")
     foo_tag = client.create_tag("foo", category="default", description="The foo tag")
     assert foo_tag.names == ["foo"]
-    tags = client.list_tags()
+    tags = client.list_tags(fields=TAG_FIELDS)
     assert len(tags.results) == 1
 
     logger.info("Testing field selection")
@@ -90,7 +97,7 @@ def test_tag(client):
     logger.info("Merging tags")
     foo_tag2 = client.merge_tags(bar_tag.names[0], bar_tag.version,
                                  foo_tag2.names[0], foo_tag2.version)
-    tags = client.list_tags()
+    tags = client.list_tags(fields=TAG_FIELDS)
     assert len(tags.results) == 1
 
     logger.info("Deleting tag")
@@ -100,13 +107,13 @@ def test_creating_posts(client):
     logger.info("Testing posts")
 
     logger.info("Listing posts")
-    posts = client.list_posts()
+    posts = client.list_posts(fields=ID_FIELDS)
     assert len(posts.results) == 0
 
     logger.info("Creating post from URL")
     wiki_post = client.create_post(url="https://upload.wikimedia.org/wikipedia/commons/thumb/5/5a/Maine_Coon_cat_by_Tomitheos.JPG/225px-Maine_Coon_cat_by_Tomitheos.JPG",
                                    safety=PostSafety.Safe)
-    posts = client.list_posts()
+    posts = client.list_posts(fields=ID_FIELDS)
     assert len(posts.results) == 1
 
     logger.info("Updating post")
@@ -115,14 +122,14 @@ def test_creating_posts(client):
 
     logger.info("Deleting post")
     client.delete_post(wiki_post.id, wiki_post.version)
-    posts = client.list_posts()
+    posts = client.list_posts(fields=ID_FIELDS)
     assert len(posts.results) == 0
 
     logger.info("Testing upload by file path")
     folly1 = client.create_post(file_path="../folly1.jpg",
                                 tags=["maine_coon", "cat", "folly1"],
                                 safety=PostSafety.Safe)
-    posts = client.list_posts()
+    posts = client.list_posts(fields=ID_FIELDS)
     assert len(posts.results) == 1
 
     folly2 = client.create_post(file_path="../folly2.jpg",
@@ -150,28 +157,29 @@ def test_creating_posts(client):
                                 safety=PostSafety.Safe)
 
     logger.info("Querying by anonymous tag")
-    cat_posts = client.list_posts(query=[anonymous_token("cat")])
+    cat_posts = client.list_posts(query=[CAT_TOKEN], fields=ID_FIELDS)
     assert len(cat_posts.results) == 4
 
     logger.info("Querying by named tag")
-    cat_posts = client.list_posts(query=[named_token(PostNamedToken.Tag, "maine_coon")])
+    cat_posts = client.list_posts(query=[MAINE_TOKEN], fields=ID_FIELDS)
     assert len(cat_posts.results) == 4
 
     logger.info("Querying using typesafe types")
-    cat_posts = client.list_posts(query=[named_token(PostNamedToken.Safety, PostSafety.Safe)])
+    cat_posts = client.list_posts(query=[named_token(PostNamedToken.Safety, PostSafety.Safe)],
+                                  fields=ID_FIELDS)
     assert len(cat_posts.results) == 4
 
     logger.info("Testing pagination")
-    cat_posts = client.list_posts(limit=1)
+    cat_posts = client.list_posts(fields=ID_FIELDS, limit=1)
     assert cat_posts.total == 4
     assert len(cat_posts.results) == 1
 
-    cat_posts2 = client.list_posts(limit=1, offset=1)
+    cat_posts2 = client.list_posts(fields=ID_FIELDS, limit=1, offset=1)
     assert cat_posts.results != cat_posts2.results
 
     logger.info("Testing tag siblings")
     tag_occurrences = client.get_tag_siblings("maine_coon")
-    cat_occurrences = list(filter(lambda x: "cat" in x.tag.names, tag_occurrences))
+    cat_occurrences = [x for x in tag_occurrences if "cat" in x.tag.names]
     assert len(cat_occurrences) == 1
 
     logger.info("Rating post")
@@ -206,7 +214,7 @@ def test_pool_categories(client):
     logger.info("Testing pool categories")
 
     logger.info("Listing pool categories")
-    pool_cats = client.list_pool_categories()
+    pool_cats = client.list_pool_categories(fields=NAME_FIELDS)
     assert len(pool_cats) != 0
 
     logger.info("Creating pool category")
@@ -231,39 +239,53 @@ def test_pool_categories(client):
 def test_pools(client):
     logger.info("Testing post pools")
     logger.info("Listing post pools")
-    pools = client.list_pools()
+    pools = client.list_pools(fields=ID_FIELDS)
     assert len(pools.results) == 0
 
     logger.info("Creating pools")
-    cat_pool = client.create_pool("cats_pool", category="cat_pool_category")
-    catz_pool = client.create_pool("catz_pool", category="cat_pool_category")
-    dogs_pool = client.create_pool("dogs_pool", category="cat_pool_category")
+    cat_pool, catz_pool, dogs_pool = client.create_pools(["cats_pool", "catz_pool", "dogs_pool"],
+                                                         category="cat_pool_category")
 
-    logger.info("Getting pool")
-    cat_pool = client.get_pool(cat_pool.id)
+    logger.info("Creating pools when one of the names is taken")
+    try:
+        client.create_pools(["cats_pool", "kittens_pool"], category="cat_pool_category")
+    except SzuruClientError as e:
+        kind, details, created = e.args
+        assert kind == "CreatePoolsError"
+        assert "cats_pool" in details
+        assert [p.names for p in created] == [["kittens_pool"]]
+    else:
+        assert False, "Creating a pool with a duplicate name should fail"
+    client.delete_pool(created[0].id, created[0].version)
 
     logger.info("Deleting pool")
     client.delete_pool(dogs_pool.id, dogs_pool.version)
 
     logger.info("Updating pool")
-    f4_results = client.list_posts([anonymous_token("cat")])
-    post_ids= list(map(lambda p: p.id, f4_results.results))
+    f4_results = client.list_posts([CAT_TOKEN], fields=ID_FIELDS)
+    post_ids = [p.id for p in f4_results.results]
     cat_pool = client.update_pool(cat_pool.id, cat_pool.version,
                                   posts=post_ids, description="All cat pictures")
     assert len(cat_pool.posts) != 0
+    assert cat_pool.description == "All cat pictures"
 
     logger.info("Merging pools")
     merged_pool = client.merge_pools(catz_pool.id, catz_pool.version, cat_pool.id, cat_pool.version)
     assert merged_pool.id == cat_pool.id
 
+    logger.info("Getting pool")
+    merged_pool = client.get_pool(merged_pool.id)
+    assert merged_pool.description == "All cat pictures"
+    assert merged_pool.names == ["cats_pool"]
+
 def test_comments(client):
     logger.info("Testing post comments")
 
     logger.info("Listing post comments")
-    comment_list = client.list_comments()
+    comment_list = client.list_comments(fields=ID_FIELDS)
     assert len(comment_list.results) == 0
 
-    cat_results = client.list_posts([anonymous_token("cat")])
+    cat_results = client.list_posts([CAT_TOKEN], fields=ID_FIELDS)
     post_id = cat_results.results[0].id
 
     logger.info("Creating comment")
@@ -278,7 +300,7 @@ def test_comments(client):
     assert comment.text == "Beautiful cat!"
 
     logger.info("Getting all comments for post")
-    comment_list = client.list_comments([named_token(CommentNamedToken.Post, post_id)])
+    comment_list = client.list_comments([named_token(CommentNamedToken.Post, post_id)], fields=ID_FIELDS)
     assert len(comment_list.results) != 0
 
     logger.info("Testing rating comments")
@@ -299,7 +321,7 @@ def test_users(client):
     logger.info("Testing users")
 
     logger.info("Listing users")
-    user_list = client.list_users()
+    user_list = client.list_users(fields=NAME_FIELDS)
 
     logger.info("Creating user with avatar")
     user = client.create_user("iu2", "ipass2", rank=UserRank.Regular, avatar_path="../avatar.jpg")
@@ -328,6 +350,42 @@ def test_users(client):
     logger.info("Deleting user token")
     client.delete_user_token("integration_user", token2.token, token2.version)
 
+def test_category_cache(client):
+    logger.info("Testing category caching")
+    cached_client = SzurubooruSyncClient("http://localhost:9802", username="integration_user",
+                                         password="integration_password", allow_insecure=True,
+                                         cache_categories=True)
+
+    logger.info("Checking tag categories are served from the cache")
+    tag_cats = cached_client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
+    other_tag_cat = client.create_tag_category("uncached_tag_cat", color="green")
+    tag_cats2 = cached_client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
+    assert len(tag_cats2) == len(tag_cats)
+
+    logger.info("Checking the tag category cache is invalidated by writes")
+    tag_cat = cached_client.create_tag_category("cached_tag_cat", color="blue")
+    tag_cats3 = cached_client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
+    assert len(tag_cats3) == len(tag_cats) + 2
+    cached_client.delete_tag_category(tag_cat.name, tag_cat.version)
+    cached_client.delete_tag_category(other_tag_cat.name, other_tag_cat.version)
+    tag_cats4 = cached_client.list_tag_categories(fields=TAG_CATEGORY_FIELDS)
+    assert len(tag_cats4) == len(tag_cats)
+
+    logger.info("Checking pool categories are served from the cache")
+    pool_cats = cached_client.list_pool_categories(fields=NAME_FIELDS)
+    other_pool_cat = client.create_pool_category("uncached_pool_cat", color="green")
+    pool_cats2 = cached_client.list_pool_categories(fields=NAME_FIELDS)
+    assert len(pool_cats2) == len(pool_cats)
+
+    logger.info("Checking the pool category cache is invalidated by writes")
+    pool_cat = cached_client.create_pool_category("cached_pool_cat", color="blue")
+    pool_cats3 = cached_client.list_pool_categories(fields=NAME_FIELDS)
+    assert len(pool_cats3) == len(pool_cats) + 2
+    cached_client.delete_pool_category(pool_cat.name, pool_cat.version)
+    cached_client.delete_pool_category(other_pool_cat.name, other_pool_cat.version)
+    pool_cats4 = cached_client.list_pool_categories(fields=NAME_FIELDS)
+    assert len(pool_cats4) == len(pool_cats)
+
 def test_snapshots(client):
     logger.info("Testing snapshots")
 
@@ -337,36 +395,30 @@ def test_snapshots(client):
 
 def test_downloads(client):
     logger.info("Testing downloads")
-    f3_hasher = hashlib.new("sha1")
-
-    with open("../folly3.jpg", "rb") as f:
-        #while (byte := f.read(1)):
-        #    f3_hasher.update(byte)
-        while True:
-            byte = f.read(1)
-            if len(byte):
-                f3_hasher.update(byte)
-            else:
-                break
-
-    f3_post = client.list_posts([anonymous_token("folly3")]).results[0]
-    with tempfile.TemporaryDirectory() as tmpdirname:
+    logger.info("Searching for a post with image")
+    f3_post = client.post_for_image("../folly3.jpg")
+    assert f3_post is not None
+    f3_sha1 = source_sha1("../folly3.jpg")
+    img_bytes = client.get_image_bytes(f3_post.id)
+    assert hashlib.sha1(img_bytes).hexdigest() == f3_sha1
+
+    # Keep the download round trip in memory where tmpfs is available
+    with tempfile.TemporaryDirectory(dir=TMPFS_DIR) as tmpdirname:
         tmpdir = pathlib.Path(tmpdirname)
         fname = tmpdir / "folly3_dl.jpg"
         #fname = "../folly4_dl.jpg"
         client.download_image_to_path(f3_post.id, fname)
-        dl_hasher = hashlib.new("sha1")
-        with open(fname, "rb") as f:
-            #while (byte := f.read(1)):
-            # dl_hasher.update(byte)
-            while True:
-                byte = f.read(1)
-                if len(byte):
-                    dl_hasher.update(byte)
-                else:
-                    break
-
-    assert f3_hasher.hexdigest() == dl_hasher.hexdigest()
+        dl_sha1 = file_sha1(fname)
+
+        logger.info("Downloading thumbnail")
+        thumb_fname = tmpdir / "folly3_thumb_dl.jpg"
+        client.download_thumbnail_to_path(f3_post.id, thumb_fname)
+        thumb_sha1 = file_sha1(thumb_fname)
+
+    assert f3_sha1 == dl_sha1
+    thumb_bytes = client.get_thumbnail_bytes(f3_post.id)
+    assert len(thumb_bytes) != 0
+    assert hashlib.sha1(thumb_bytes).hexdigest() == thumb_sha1
 
 if __name__ == "__main__":
     client = connect()
@@ -379,4 +431,5 @@ if __name__ == "__main__":
     test_comments(client)
     test_users(client)
     test_snapshots(client)
+    test_category_cache(client)
     test_downloads(client)
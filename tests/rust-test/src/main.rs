@@ -604,36 +604,45 @@ async fn test_pools(client: &SzurubooruClient) {
     assert_eq!(pools.total, 0);
 
     info!("Creating pools");
-    let create_pool = CreateUpdatePoolBuilder::default()
-        .names(vec!["cats_pool".to_string()])
-        .category("cat_pool_category".to_string())
-        .build()
-        .expect("Could not build pool creation object");
-    let cat_pool = client
-        .request()
-        .create_pool(&create_pool)
-        .await
-        .expect("Could not create pool");
-    let create_pool2 = CreateUpdatePoolBuilder::default()
-        .names(vec!["catz_pool".to_string()])
-        .category("cat_pool_category".to_string())
-        .build()
-        .expect("Could not build pool creation object");
-    let catz_pool = client
+    let create_pools = ["cats_pool", "catz_pool", "dogs_pool"]
+        .iter()
+        .map(|name| {
+            CreateUpdatePoolBuilder::default()
+                .names(vec![name.to_string()])
+                .category("cat_pool_category".to_string())
+                .build()
+                .expect("Could not build pool creation object")
+        })
+        .collect::<Vec<_>>();
+    let mut pools = client
         .request()
-        .create_pool(&create_pool2)
+        .create_pools(&create_pools)
         .await
-        .expect("Could not create pool");
-    let create_pool3 = CreateUpdatePoolBuilder::default()
-        .names(vec!["dogs_pool".to_string()])
-        .category("cat_pool_category".to_string())
-        .build()
-        .expect("Could not build pool creation object");
-    let dogs_pool = client
+        .into_iter()
+        .map(|r| r.expect("Could not create pool"));
+    let cat_pool = pools.next().unwrap();
+    let catz_pool = pools.next().unwrap();
+    let dogs_pool = pools.next().unwrap();
+
+    info!("Creating pools when one of the names is taken");
+    let create_pools = ["cats_pool", "kittens_pool"]
+        .iter()
+        .map(|name| {
+            CreateUpdatePoolBuilder::default()
+                .names(vec![name.to_string()])
+                .category("cat_pool_category".to_string())
+                .build()
+                .expect("Could not build pool creation object")
+        })
+        .collect::<Vec<_>>();
+    let results = client.request().create_pools(&create_pools).await;
+    assert!(results[0].is_err());
+    let kittens_pool = results[1].as_ref().expect("Could not create pool");
+    client
         .request()
-        .create_pool(&create_pool3)
+        .delete_pool(kittens_pool.id.unwrap(), kittens_pool.version.unwrap())
         .await
-        .expect("Could not create pool");
+        .expect("Could not delete pool");
 
     info!("Getting pool");
     let cat_pool = client